@@ -0,0 +1,368 @@
+#!/usr/bin/python3
+"""
+cache_hashtable.py
+
+A bounded cache built on HashTable.
+
+Entries live in the HashTable buckets as entry records that are also
+threaded onto doubly linked eviction lists, so every lookup, add and
+eviction is O(1).
+
+Eviction policies:
+- "lru": evict the least recently used entry
+- "lfu": evict the least frequently used entry (ties go to the least
+  recently used one at that frequency)
+- "ttl": entries expire ``ttl`` seconds after being added; when the
+  cache is full, the entry closest to expiring is evicted
+
+A ``ttl`` may also be given with "lru" or "lfu". Every entry gets the
+same ttl, so entries expire in the order they were added or updated:
+the "ttl" list is already in that order, and with the other policies
+entries are also threaded onto a separate expiry list. Expired entries
+are dropped from the head of that list on every add and lookup, and
+before the size is reported, in amortised O(1).
+
+Limits can be set on the number of entries, the estimated number of
+bytes, or both. Hits, misses, evictions and expirations are counted
+for monitoring.
+"""
+
+import sys
+import time
+
+from hashtable import HashTable
+
+POLICIES = ("lru", "lfu", "ttl")
+
+
+def _default_sizeof(key, value) -> int:
+    return sys.getsizeof(key) + sys.getsizeof(value)
+
+
+class _CacheEntry:
+    """A cached value together with its eviction bookkeeping."""
+
+    __slots__ = ("key", "value", "size", "expires_at", "frequency", "prev", "next",
+                 "expiry_prev", "expiry_next")
+
+    def __init__(self, key=None, value=None, size=0, expires_at=None):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.frequency = 1
+        self.prev = self
+        self.next = self
+        self.expiry_prev = self
+        self.expiry_next = self
+
+
+def _append(sentinel: _CacheEntry, entry: _CacheEntry) -> None:
+    """Link an entry at the tail of a circular list."""
+    entry.prev = sentinel.prev
+    entry.next = sentinel
+    sentinel.prev.next = entry
+    sentinel.prev = entry
+
+
+def _unlink(entry: _CacheEntry) -> None:
+    """Detach an entry from whichever list it is on."""
+    entry.prev.next = entry.next
+    entry.next.prev = entry.prev
+    entry.prev = entry.next = entry
+
+
+def _append_expiry(sentinel: _CacheEntry, entry: _CacheEntry) -> None:
+    """Link an entry at the tail of the circular expiry list."""
+    entry.expiry_prev = sentinel.expiry_prev
+    entry.expiry_next = sentinel
+    sentinel.expiry_prev.expiry_next = entry
+    sentinel.expiry_prev = entry
+
+
+def _unlink_expiry(entry: _CacheEntry) -> None:
+    """Detach an entry from the expiry list (a no-op if it is not on it)."""
+    entry.expiry_prev.expiry_next = entry.expiry_next
+    entry.expiry_next.expiry_prev = entry.expiry_prev
+    entry.expiry_prev = entry.expiry_next = entry
+
+
+class CacheHashTable(HashTable):
+    """
+    A HashTable that evicts entries to stay within its limits.
+    """
+
+    def __init__(self, max_entries: int = None, max_bytes: int = None,
+                 policy: str = "lru", ttl: float = None,
+                 hash_function="char_sum", sizeof=_default_sizeof,
+                 clock=time.monotonic):
+        """
+        Args:
+            max_entries (int): Maximum number of entries, or None.
+            max_bytes (int): Maximum estimated size in bytes, or None.
+            policy (str): One of "lru", "lfu" or "ttl".
+            ttl (float): Seconds an entry stays valid, or None.
+                Required for the "ttl" policy.
+            hash_function: Hash function name or callable (see HashTable).
+            sizeof (callable): Estimates the bytes used by (key, value).
+            clock (callable): Returns the current time in seconds.
+
+        Raises:
+            ValueError: If the policy, limits or ttl are not valid.
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if policy == "ttl" and ttl is None:
+            raise ValueError("the ttl policy requires a ttl")
+
+        super().__init__(hash_function)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+
+        self._bytes = 0
+        # LRU and TTL use a single list; LFU keeps one list per frequency
+        self._lists = {1: _CacheEntry()}
+        self._min_frequency = 1
+        # Expiry order for "lru" and "lfu" with a ttl; the "ttl" list
+        # is already in expiry order
+        self._expiry = _CacheEntry()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _get_entry(self, key):
+        """Return the entry record stored for ``key``, or None."""
+        return super().lookup(key)
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= self._clock()
+
+    def _drop(self, entry: _CacheEntry) -> None:
+        """Remove an entry from both the buckets and its eviction list."""
+        sentinel = self._lists.get(entry.frequency) if self.policy == "lfu" else None
+        _unlink(entry)
+        _unlink_expiry(entry)
+
+        if sentinel is not None and sentinel.next is sentinel and entry.frequency != 1:
+            del self._lists[entry.frequency]
+
+        super().remove(entry.key)
+        self._bytes -= entry.size
+
+    def _purge_expired(self) -> None:
+        """Drop every expired entry, starting with the oldest."""
+        if self.ttl is None:
+            return
+
+        now = self._clock()
+
+        if self.policy == "ttl":
+            sentinel = self._lists[1]
+            while sentinel.next is not sentinel and sentinel.next.expires_at <= now:
+                self.expirations += 1
+                self._drop(sentinel.next)
+        else:
+            sentinel = self._expiry
+            while (sentinel.expiry_next is not sentinel
+                   and sentinel.expiry_next.expires_at <= now):
+                self.expirations += 1
+                self._drop(sentinel.expiry_next)
+
+    def _touch(self, entry: _CacheEntry) -> None:
+        """Record a hit on an entry according to the eviction policy."""
+        if self.policy == "lru":
+            _unlink(entry)
+            _append(self._lists[1], entry)
+
+        elif self.policy == "lfu":
+            frequency = entry.frequency
+            _unlink(entry)
+
+            sentinel = self._lists[frequency]
+            if sentinel.next is sentinel:
+                if frequency != 1:
+                    del self._lists[frequency]
+                if self._min_frequency == frequency:
+                    self._min_frequency = frequency + 1
+
+            entry.frequency = frequency + 1
+            if entry.frequency not in self._lists:
+                self._lists[entry.frequency] = _CacheEntry()
+            _append(self._lists[entry.frequency], entry)
+
+    def _victim(self) -> _CacheEntry:
+        """Return the entry the policy would evict next."""
+        if self.policy == "lfu":
+            sentinel = self._lists.get(self._min_frequency)
+            if sentinel is None or sentinel.next is sentinel:
+                # Removals can leave the minimum stale; recompute it
+                self._min_frequency = min(
+                    frequency for frequency, sentinel in self._lists.items()
+                    if sentinel.next is not sentinel
+                )
+            return self._lists[self._min_frequency].next
+
+        return self._lists[1].next
+
+    def _over_limit(self, extra_entries: int, extra_bytes: int) -> bool:
+        return (
+            (self.max_entries is not None
+             and self._size + extra_entries > self.max_entries)
+            or (self.max_bytes is not None
+                and self._bytes + extra_bytes > self.max_bytes)
+        )
+
+    def _evict(self, extra_entries: int = 0, extra_bytes: int = 0) -> None:
+        """
+        Evict entries until the cache, plus room for ``extra_entries``
+        and ``extra_bytes``, is within its limits.
+        """
+        while self._size and self._over_limit(extra_entries, extra_bytes):
+            entry = self._victim()
+            if self._is_expired(entry):
+                self.expirations += 1
+            else:
+                self.evictions += 1
+            self._drop(entry)
+
+    def add(self, key, value) -> None:
+        """
+        Add or update a key-value pair, evicting entries if needed.
+
+        Updating an entry counts as a use and restarts its ttl. A value
+        larger than ``max_bytes`` on its own is not cached.
+
+        Args:
+            key (str): The key to store.
+            value: The value associated with the key.
+        """
+        self._purge_expired()
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        size = self._sizeof(key, value)
+        entry = self._get_entry(key)
+
+        if self.max_bytes is not None and size > self.max_bytes:
+            if entry is not None:
+                self._drop(entry)
+            return
+
+        if entry is not None:
+            self._bytes += size - entry.size
+            entry.value = value
+            entry.size = size
+            entry.expires_at = expires_at
+            if self.policy == "ttl":
+                _unlink(entry)
+                _append(self._lists[1], entry)
+            else:
+                self._touch(entry)
+                if self.ttl is not None:
+                    _unlink_expiry(entry)
+                    _append_expiry(self._expiry, entry)
+            self._evict()
+        else:
+            # Make room first so the new entry is never its own victim
+            self._evict(1, size)
+            entry = _CacheEntry(key, value, size, expires_at)
+            super().add(key, entry)
+            _append(self._lists[1], entry)
+            if self.ttl is not None and self.policy != "ttl":
+                _append_expiry(self._expiry, entry)
+            self._min_frequency = 1
+            self._bytes += size
+
+    def lookup(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            The value if the key exists and has not expired, otherwise None.
+        """
+        self._purge_expired()
+        entry = self._get_entry(key)
+
+        if entry is not None and self._is_expired(entry):
+            self.expirations += 1
+            self._drop(entry)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def remove(self, key) -> None:
+        """
+        Remove a key-value pair from the cache.
+
+        Args:
+            key (str): The key to remove.
+        """
+        entry = self._get_entry(key)
+
+        if entry is not None:
+            self._drop(entry)
+
+    def add_many(self, pairs) -> None:
+        """
+        Add or update many key-value pairs, evicting as needed.
+
+        Args:
+            pairs: Iterable of (key, value) pairs.
+        """
+        for key, value in pairs:
+            self.add(key, value)
+
+    def __contains__(self, key) -> bool:
+        entry = self._get_entry(key)
+        return entry is not None and not self._is_expired(entry)
+
+    def __len__(self) -> int:
+        self._purge_expired()
+        return self._size
+
+    def _entries(self):
+        """Yield every (key, value) pair that has not expired."""
+        self._purge_expired()
+        for key, entry in super()._entries():
+            if not self._is_expired(entry):
+                yield key, entry.value
+
+    def stats(self) -> dict:
+        """
+        Report the cache counters for monitoring.
+
+        Returns:
+            dict: size, bytes, hits, misses, hit_rate, evictions
+            and expirations.
+        """
+        self._purge_expired()
+        requests = self.hits + self.misses
+
+        return {
+            "size": self._size,
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,295 @@
+#!/usr/bin/python3
+"""
+compact_hashtable.py
+
+A memory-compact storage engine for HashTable.
+
+The dict-of-dicts layout of HashTable spends a whole dictionary per
+bucket. CompactHashTable instead follows the layout of CPython's own
+compact dict:
+
+- a sparse index (``array``) of small integers pointing into
+  the dense entries, using the narrowest integer type that fits
+- dense, parallel arrays of cached 64-bit hash codes (``array('Q')``),
+  keys and values
+
+Cached hash codes mean resizing never calls the hash function again,
+and string keys are interned so repeated keys share one object.
+Collisions in the index are resolved with linear probing, which needs
+well-mixed low hash bits, so the table defaults to the "fnv1a" hash
+rather than the character-sum hash of HashTable.
+
+Time Complexity (expected): O(1) for add, lookup and remove
+Space Complexity: O(n)
+"""
+
+import sys
+from array import array
+
+from hashtable import HashTable
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_EMPTY = -1
+
+
+def _index_typecode(capacity: int) -> str:
+    """Pick the narrowest signed array type able to index ``capacity`` entries."""
+    for typecode in ("b", "h", "i", "q"):
+        if capacity <= 1 << (array(typecode).itemsize * 8 - 1):
+            return typecode
+    raise OverflowError("capacity too large")
+
+
+class CompactHashTable(HashTable):
+    """
+    A hash table storing entries in parallel arrays behind a compact index.
+
+    Keeps the ``add`` / ``lookup`` / ``remove`` API of HashTable.
+    """
+
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity: int = MIN_CAPACITY, hash_function="fnv1a"):
+        """
+        Initialize an empty compact table.
+
+        Args:
+            capacity (int): Initial number of index slots (rounded up to a
+                power of two, at least MIN_CAPACITY).
+            hash_function: Hash function name or callable (see HashTable).
+
+        Raises:
+            TypeError: If capacity is not an integer.
+        """
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an integer")
+
+        super().__init__(hash_function)
+        # Parallel arrays replace the dictionary of buckets
+        self.collection = None
+        self._hashes = array("Q")
+        self._keys = []
+        self._values = []
+
+        rounded = self.MIN_CAPACITY
+        while rounded < capacity:
+            rounded *= 2
+        self._build_index(rounded)
+
+    def _build_index(self, capacity: int) -> None:
+        """Rebuild the sparse index from the cached hash codes."""
+        index = array(_index_typecode(capacity), [_EMPTY]) * capacity
+        mask = capacity - 1
+
+        for entry, hashed_key in enumerate(self._hashes):
+            slot = hashed_key & mask
+            while index[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+            index[slot] = entry
+
+        self._index = index
+        self._mask = mask
+
+    def _find(self, hashed_key: int, key):
+        """
+        Probe the index for ``key``.
+
+        Returns:
+            tuple: (slot, entry) where entry is _EMPTY if the key is
+            missing and slot is then the free slot it would occupy.
+        """
+        index = self._index
+        mask = self._mask
+        hashes = self._hashes
+        keys = self._keys
+        slot = hashed_key & mask
+
+        while True:
+            entry = index[slot]
+            if entry == _EMPTY:
+                return slot, _EMPTY
+            if hashes[entry] == hashed_key:
+                stored = keys[entry]
+                if stored is key or stored == key:
+                    return slot, entry
+            slot = (slot + 1) & mask
+
+    def _slot_of_entry(self, entry: int) -> int:
+        """Find the index slot that points at a given dense entry."""
+        index = self._index
+        mask = self._mask
+        slot = self._hashes[entry] & mask
+
+        while index[slot] != entry:
+            slot = (slot + 1) & mask
+
+        return slot
+
+    def _clear_slot(self, slot: int) -> None:
+        """
+        Empty an index slot, moving later entries of the probe run back
+        so that every entry stays reachable from its home slot.
+        """
+        index = self._index
+        mask = self._mask
+        hashes = self._hashes
+        probe = slot
+
+        while True:
+            probe = (probe + 1) & mask
+            entry = index[probe]
+            if entry == _EMPTY:
+                break
+
+            home = hashes[entry] & mask
+            # Leave the entry alone if its home lies cyclically in (slot, probe]
+            if slot <= probe:
+                if slot < home <= probe:
+                    continue
+            elif slot < home or home <= probe:
+                continue
+
+            index[slot] = entry
+            slot = probe
+
+        index[slot] = _EMPTY
+
+    def _hash_key(self, key) -> int:
+        """Hash a key and reduce it to the 64 bits cached per entry."""
+        return self.hash(key) & _MASK64
+
+    def add(self, key, value) -> None:
+        """
+        Add or update a key-value pair in the hash table.
+
+        Args:
+            key (str): The key to store.
+            value: The value associated with the key.
+        """
+        if type(key) is str:
+            key = sys.intern(key)
+
+        hashed_key = self._hash_key(key)
+        slot, entry = self._find(hashed_key, key)
+
+        if entry != _EMPTY:
+            self._values[entry] = value
+            return
+
+        self._index[slot] = len(self._keys)
+        self._hashes.append(hashed_key)
+        self._keys.append(key)
+        self._values.append(value)
+
+        # Keep the index at most two thirds full
+        if len(self._keys) * 3 > len(self._index) * 2:
+            self._build_index(len(self._index) * 2)
+
+    def lookup(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            The value if the key exists, otherwise None.
+        """
+        _, entry = self._find(self._hash_key(key), key)
+
+        if entry == _EMPTY:
+            return None
+
+        return self._values[entry]
+
+    def remove(self, key) -> None:
+        """
+        Remove a key-value pair from the hash table.
+
+        The last dense entry is moved into the freed position so the
+        parallel arrays never contain holes.
+
+        Args:
+            key (str): The key to remove.
+        """
+        slot, entry = self._find(self._hash_key(key), key)
+
+        if entry == _EMPTY:
+            return
+
+        self._clear_slot(slot)
+
+        last = len(self._keys) - 1
+        if entry != last:
+            self._index[self._slot_of_entry(last)] = entry
+            self._hashes[entry] = self._hashes[last]
+            self._keys[entry] = self._keys[last]
+            self._values[entry] = self._values[last]
+
+        self._hashes.pop()
+        self._keys.pop()
+        self._values.pop()
+
+        capacity = len(self._index)
+        if capacity > self.MIN_CAPACITY and len(self._keys) * 8 < capacity:
+            self._build_index(capacity // 2)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return self._find(self._hash_key(key), key)[1] != _EMPTY
+
+    def _entries(self):
+        """Yield every stored (key, value) pair, in dense array order."""
+        yield from zip(self._keys, self._values)
+
+    def _reserve(self, count: int) -> None:
+        """Grow the index once so that ``count`` more entries fit."""
+        needed = len(self._keys) + count
+        capacity = len(self._index)
+
+        while needed * 3 > capacity * 2:
+            capacity *= 2
+
+        if capacity != len(self._index):
+            self._build_index(capacity)
+
+    def add_many(self, pairs) -> None:
+        """
+        Add or update many key-value pairs, growing the index at most once.
+
+        Args:
+            pairs: Iterable of (key, value) pairs.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+
+        self._reserve(len(pairs))
+
+        add = self.add
+        for key, value in pairs:
+            add(key, value)
+
+    def memory_usage(self) -> dict:
+        """
+        Measure the memory used by the table's own structures.
+
+        Key and value objects are excluded, since every layout shares them.
+
+        Returns:
+            dict: entries, bytes, and bytes_per_entry.
+        """
+        total = (
+            sys.getsizeof(self._index)
+            + sys.getsizeof(self._hashes)
+            + sys.getsizeof(self._keys)
+            + sys.getsizeof(self._values)
+        )
+        entries = len(self._keys)
+
+        return {
+            "entries": entries,
+            "bytes": total,
+            "bytes_per_entry": total / entries if entries else 0.0,
+        }
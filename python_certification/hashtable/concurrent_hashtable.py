@@ -0,0 +1,284 @@
+#!/usr/bin/python3
+"""
+concurrent_hashtable.py
+
+A thread-safe HashTable using lock striping.
+
+Buckets are split into a fixed number of stripes by hash value, and
+each stripe is guarded by its own read-write lock. Operations on keys
+in different stripes never wait for each other, and lookups in the
+same stripe run side by side; only writers to the same stripe are
+serialized. The bucket dictionary itself is shared: single dictionary
+operations are atomic, so a stripe lock only has to protect the
+buckets that belong to it.
+
+Atomic ``get_or_add`` and ``compute_if_absent`` let concurrent writers
+create an entry exactly once without an outer lock.
+"""
+
+import threading
+from contextlib import contextmanager
+
+from hashtable import HashTable
+
+_MISSING = object()
+
+
+class ReadWriteLock:
+    """
+    A lock allowing many readers or a single writer.
+
+    Waiting writers take priority over new readers so that a steady
+    stream of lookups cannot starve an update.
+
+    The lock is not reentrant: the thread holding it for writing gets a
+    RuntimeError if it tries to acquire it again, instead of waiting
+    for itself forever.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writer_thread = None
+        self._waiting_writers = 0
+
+    def _check_not_writing(self) -> None:
+        """Raise if the calling thread already holds the write lock."""
+        if self._writer and self._writer_thread == threading.get_ident():
+            raise RuntimeError("lock is already held for writing by this thread")
+
+    def acquire_read(self) -> None:
+        with self._condition:
+            self._check_not_writing()
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        with self._condition:
+            self._check_not_writing()
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+            self._writer_thread = threading.get_ident()
+
+    def release_write(self) -> None:
+        with self._condition:
+            self._writer = False
+            self._writer_thread = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Context manager holding the lock for reading."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """Context manager holding the lock for writing."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentHashTable(HashTable):
+    """
+    A HashTable safe to share between threads, using one read-write
+    lock per stripe of buckets.
+    """
+
+    def __init__(self, stripes: int = 16, hash_function="char_sum"):
+        """
+        Args:
+            stripes (int): Number of independently locked bucket ranges.
+            hash_function: Hash function name or callable (see HashTable).
+
+        Raises:
+            TypeError: If stripes is not an integer.
+            ValueError: If stripes < 1.
+        """
+        if not isinstance(stripes, int):
+            raise TypeError("stripes must be an integer")
+        if stripes < 1:
+            raise ValueError("stripes must be >= 1")
+
+        super().__init__(hash_function)
+        self._locks = [ReadWriteLock() for _ in range(stripes)]
+        # Entry counts per stripe, each guarded by that stripe's lock
+        self._counts = [0] * stripes
+
+    def _stripe_of(self, hashed_key: int) -> int:
+        """Return the stripe number owning the bucket of a hash value."""
+        return hashed_key % len(self._locks)
+
+    def _lock_for(self, hashed_key: int) -> ReadWriteLock:
+        """Return the lock guarding the bucket of a hash value."""
+        return self._locks[self._stripe_of(hashed_key)]
+
+    def add(self, key, value) -> None:
+        """
+        Add or update a key-value pair in the hash table.
+
+        Args:
+            key (str): The key to store.
+            value: The value associated with the key.
+        """
+        hashed_key = self.hash(key)
+
+        stripe = self._stripe_of(hashed_key)
+
+        with self._locks[stripe].write_locked():
+            bucket = self.collection.get(hashed_key)
+            if bucket is None:
+                bucket = self.collection[hashed_key] = {}
+            if key not in bucket:
+                self._counts[stripe] += 1
+            bucket[key] = value
+
+    def lookup(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            The value if the key exists, otherwise None.
+        """
+        hashed_key = self.hash(key)
+
+        with self._lock_for(hashed_key).read_locked():
+            bucket = self.collection.get(hashed_key)
+            if bucket is None:
+                return None
+            return bucket.get(key)
+
+    def remove(self, key) -> None:
+        """
+        Remove a key-value pair from the hash table.
+
+        Args:
+            key (str): The key to remove.
+        """
+        hashed_key = self.hash(key)
+
+        stripe = self._stripe_of(hashed_key)
+
+        with self._locks[stripe].write_locked():
+            bucket = self.collection.get(hashed_key)
+            if bucket and key in bucket:
+                del bucket[key]
+                self._counts[stripe] -= 1
+                if not bucket:
+                    del self.collection[hashed_key]
+
+    def __len__(self) -> int:
+        return sum(self._counts)
+
+    def __contains__(self, key) -> bool:
+        hashed_key = self.hash(key)
+
+        with self._lock_for(hashed_key).read_locked():
+            bucket = self.collection.get(hashed_key)
+            return bucket is not None and key in bucket
+
+    def _entries(self):
+        """
+        Yield (key, value) pairs without blocking writers for the whole
+        iteration.
+
+        Each bucket is copied under its stripe's read lock, so entries
+        added or removed while iterating may or may not be seen.
+        """
+        for hashed_key in list(self.collection):
+            with self._lock_for(hashed_key).read_locked():
+                bucket = self.collection.get(hashed_key)
+                items = list(bucket.items()) if bucket else []
+            yield from items
+
+    def add_many(self, pairs) -> None:
+        """
+        Add or update many key-value pairs, locking each stripe per pair.
+
+        Args:
+            pairs: Iterable of (key, value) pairs.
+        """
+        for key, value in pairs:
+            self.add(key, value)
+
+    def compute_if_absent(self, key, factory):
+        """
+        Return the value for ``key``, creating it with ``factory(key)``
+        if the key is missing.
+
+        The factory runs at most once per missing key, even when many
+        threads ask for the same key at the same time. It runs while the
+        key's stripe is locked for writing, so it must not use the table:
+        touching the same stripe raises RuntimeError.
+
+        Args:
+            key (str): The key to look up or create.
+            factory (callable): Called with the key to build a new value.
+
+        Returns:
+            The existing or newly created value.
+
+        Raises:
+            RuntimeError: If the factory uses the key's stripe of the table.
+        """
+        hashed_key = self.hash(key)
+        stripe = self._stripe_of(hashed_key)
+        lock = self._locks[stripe]
+
+        # Fast path: most calls find the key and only need a read lock
+        with lock.read_locked():
+            bucket = self.collection.get(hashed_key)
+            if bucket is not None:
+                value = bucket.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+        with lock.write_locked():
+            bucket = self.collection.get(hashed_key)
+
+            # Another writer may have won the race since the read
+            if bucket is not None:
+                value = bucket.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+            value = factory(key)
+            if bucket is None:
+                bucket = self.collection[hashed_key] = {}
+            bucket[key] = value
+            self._counts[stripe] += 1
+            return value
+
+    def get_or_add(self, key, value):
+        """
+        Return the value for ``key``, storing ``value`` first if the key
+        is missing.
+
+        Args:
+            key (str): The key to look up or create.
+            value: The value to store when the key is missing.
+
+        Returns:
+            The existing value, or ``value`` if it was added.
+        """
+        return self.compute_if_absent(key, lambda _: value)
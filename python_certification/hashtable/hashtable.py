@@ -4,26 +4,88 @@ HashTable Module
 
 This module provides a simple implementation of a hash table using
 separate chaining to handle collisions. Keys are hashed using a
-basic character-sum hash function, and values are stored in buckets
-implemented as dictionaries.
+basic character-sum hash function by default (see hash_functions.py
+for better distributed alternatives), and values are stored in
+buckets implemented as dictionaries.
 
 This implementation is intended for educational purposes to
 demonstrate core hash table concepts such as hashing, collision
 handling, and CRUD-like operations.
 """
 
+import sys
+
+from hash_functions import resolve_hash_function
+
+
+class _TableView:
+    """Base class for live views over the entries of a HashTable."""
+
+    __slots__ = ("_table",)
+
+    def __init__(self, table):
+        self._table = table
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class KeysView(_TableView):
+    """A live view of the keys of a HashTable."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return (key for key, _ in self._table._entries())
+
+    def __contains__(self, key) -> bool:
+        return key in self._table
+
+
+class ValuesView(_TableView):
+    """A live view of the values of a HashTable."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return (value for _, value in self._table._entries())
+
+
+class ItemsView(_TableView):
+    """A live view of the (key, value) pairs of a HashTable."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._table._entries()
+
+    def __contains__(self, item) -> bool:
+        key, value = item
+        return key in self._table and self._table.lookup(key) == value
+
 
 class HashTable:
     """
     A simple hash table implementation using separate chaining.
     """
 
-    def __init__(self):
+    def __init__(self, hash_function="char_sum"):
         """
         Initialize the hash table with an empty collection.
         Each hash value maps to a bucket (dictionary).
+
+        Args:
+            hash_function: Name of a function in
+                hash_functions.HASH_FUNCTIONS ("char_sum", "fnv1a",
+                "polynomial", "siphash") or any callable taking a key
+                and returning an int.
         """
         self.collection = {}
+        self.hash_function = resolve_hash_function(hash_function)
+        self._size = 0
 
     def hash(self, key: str) -> int:
         """
@@ -35,7 +97,7 @@ class HashTable:
         Returns:
             int: The computed hash value.
         """
-        return sum(ord(char) for char in key)
+        return self.hash_function(key)
 
     def add(self, key, value) -> None:
         """
@@ -50,7 +112,11 @@ class HashTable:
         if hashed_key not in self.collection:
             self.collection[hashed_key] = {}
 
-        self.collection[hashed_key][key] = value
+        bucket = self.collection[hashed_key]
+        if key not in bucket:
+            self._size += 1
+
+        bucket[key] = value
 
     def lookup(self, key):
         """
@@ -82,7 +148,151 @@ class HashTable:
 
         if bucket and key in bucket:
             del bucket[key]
+            self._size -= 1
 
             # Remove empty bucket to keep table clean
             if not bucket:
                 del self.collection[hashed_key]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        bucket = self.collection.get(self.hash(key))
+        return bucket is not None and key in bucket
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self) -> KeysView:
+        """Return a live view of the table's keys."""
+        return KeysView(self)
+
+    def values(self) -> ValuesView:
+        """Return a live view of the table's values."""
+        return ValuesView(self)
+
+    def items(self) -> ItemsView:
+        """Return a live view of the table's (key, value) pairs."""
+        return ItemsView(self)
+
+    def _entries(self):
+        """Yield every stored (key, value) pair, in no particular order."""
+        for bucket in self.collection.values():
+            yield from bucket.items()
+
+    def save(self, path: str) -> None:
+        """
+        Save the table to a memory-mappable snapshot file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        from snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    @staticmethod
+    def open(path: str):
+        """
+        Open a snapshot written by save() for read-only lookups.
+
+        The file is memory-mapped rather than loaded, so opening is
+        near-instant and processes share the same pages.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            MappedHashTable: A read-only table backed by the file.
+        """
+        from snapshot import MappedHashTable
+
+        return MappedHashTable(path)
+
+    def _reserve(self, count: int) -> None:
+        """
+        Prepare for ``count`` more entries.
+
+        The bucket dictionary grows on its own, so nothing is needed
+        here; storage engines with fixed capacity override this.
+        """
+
+    def add_many(self, pairs) -> None:
+        """
+        Add or update many key-value pairs at once.
+
+        Args:
+            pairs: Iterable of (key, value) pairs.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+
+        self._reserve(len(pairs))
+
+        hash_function = self.hash_function
+        collection = self.collection
+
+        for key, value in pairs:
+            hashed_key = hash_function(key)
+            bucket = collection.get(hashed_key)
+
+            if bucket is None:
+                bucket = collection[hashed_key] = {}
+
+            if key not in bucket:
+                self._size += 1
+
+            bucket[key] = value
+
+    def lookup_many(self, keys, lazy: bool = False):
+        """
+        Retrieve the values for many keys.
+
+        Args:
+            keys: Iterable of keys to look up.
+            lazy (bool): If True, return an iterator that looks keys up
+                as it is consumed instead of building a list.
+
+        Returns:
+            list | iterator: Values in the order of ``keys``, with None
+            for missing keys.
+        """
+        values = map(self.lookup, keys)
+
+        if lazy:
+            return values
+
+        return list(values)
+
+    def remove_many(self, keys) -> None:
+        """
+        Remove many keys at once.
+
+        Args:
+            keys: Iterable of keys to remove.
+        """
+        for key in keys:
+            self.remove(key)
+
+    def memory_usage(self) -> dict:
+        """
+        Measure the memory used by the table's own structures.
+
+        Key and value objects are excluded, since every layout shares them.
+
+        Returns:
+            dict: entries, bytes, and bytes_per_entry.
+        """
+        total = sys.getsizeof(self.collection)
+        entries = 0
+
+        for hashed_key, bucket in self.collection.items():
+            total += sys.getsizeof(hashed_key) + sys.getsizeof(bucket)
+            entries += len(bucket)
+
+        return {
+            "entries": entries,
+            "bytes": total,
+            "bytes_per_entry": total / entries if entries else 0.0,
+        }
@@ -22,6 +22,17 @@ def main():
     table.remove("golf")
     print("Lookup 'golf' after removal:", table.lookup("golf"))
 
+    table.add_many([("swim", "sport"), ("draw", "hobby"), ("chess", "game")])
+    print("Lookup many:", table.lookup_many(["swim", "draw", "golf"]))
+
+    table.remove_many(["swim", "draw"])
+    print("Lookup many after removal:", table.lookup_many(["swim", "draw", "chess"]))
+
+    print("Number of entries:", len(table))
+    print("Contains 'read'?", "read" in table)
+    print("Keys:", list(table.keys()))
+    print("Items:", list(table.items()))
+
 
 if __name__ == "__main__":
     main()
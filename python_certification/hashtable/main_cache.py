@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+"""
+Main module demonstrating usage of the CacheHashTable class.
+"""
+
+from cache_hashtable import CacheHashTable
+
+
+def main():
+    cache = CacheHashTable(max_entries=2, policy="lru")
+
+    cache.add("golf", "sport")
+    cache.add("read", "activity")
+    cache.lookup("golf")
+    cache.add("code", "programming")
+
+    print("LRU lookup 'read' (evicted):", cache.lookup("read"))
+    print("LRU lookup 'golf':", cache.lookup("golf"))
+    print("LRU stats:", cache.stats())
+
+    cache = CacheHashTable(max_entries=2, policy="lfu")
+
+    cache.add("golf", "sport")
+    cache.add("read", "activity")
+    cache.lookup("read")
+    cache.lookup("read")
+    cache.lookup("golf")
+    cache.add("code", "programming")
+
+    print("\nLFU lookup 'golf' (evicted):", cache.lookup("golf"))
+    print("LFU lookup 'read':", cache.lookup("read"))
+    print("LFU stats:", cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+#!/usr/bin/python3
+"""
+Main module comparing the memory use of HashTable storage layouts.
+"""
+
+from compact_hashtable import CompactHashTable
+from hashtable import HashTable
+from open_addressing import OpenAddressingHashTable
+
+
+def main():
+    pairs = [(f"SKU-{index:07d}", index) for index in range(100000)]
+
+    for table in (
+        HashTable(hash_function="fnv1a"),
+        OpenAddressingHashTable(hash_function="fnv1a"),
+        CompactHashTable(hash_function="fnv1a"),
+    ):
+        table.add_many(pairs)
+        usage = table.memory_usage()
+        print(f"{type(table).__name__:>24}: "
+              f"{usage['bytes_per_entry']:.1f} bytes per entry")
+
+
+if __name__ == "__main__":
+    main()
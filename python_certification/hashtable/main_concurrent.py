@@ -0,0 +1,31 @@
+#!/usr/bin/python3
+"""
+Main module demonstrating usage of the ConcurrentHashTable class.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from concurrent_hashtable import ConcurrentHashTable
+
+
+def main():
+    table = ConcurrentHashTable(stripes=8, hash_function="fnv1a")
+    created = []
+
+    def load_profile(user):
+        created.append(user)
+        return {"name": user}
+
+    users = [f"user-{index % 10}" for index in range(1000)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda user: table.compute_if_absent(user, load_profile), users))
+
+    print("Profiles created:", len(created))
+    print("Lookup 'user-3':", table.lookup("user-3"))
+    print("get_or_add 'user-3':", table.get_or_add("user-3", {"name": "other"}))
+    print("get_or_add 'user-42':", table.get_or_add("user-42", {"name": "user-42"}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+"""
+Main module comparing the pluggable hash functions of HashTable.
+"""
+
+from hash_functions import collision_report
+from hashtable import HashTable
+
+
+def main():
+    for name in ("char_sum", "fnv1a", "polynomial", "siphash"):
+        table = HashTable(hash_function=name)
+        print(f"{name:>10}: 'abc' -> {table.hash('abc')}, 'cba' -> {table.hash('cba')}")
+
+    keys = [f"SKU-{index:06d}" for index in range(10000)]
+
+    print("\nCollision report for 10000 SKU-like keys (1024 buckets):")
+    report = collision_report(keys, buckets=1024)
+    for name, stats in report.items():
+        print(f"{name:>10}: {stats}")
+
+
+if __name__ == "__main__":
+    main()
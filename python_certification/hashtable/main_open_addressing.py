@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+"""
+Main module demonstrating usage of the OpenAddressingHashTable class.
+"""
+
+from open_addressing import OpenAddressingHashTable
+
+
+def main():
+    table = OpenAddressingHashTable(hash_function="fnv1a")
+
+    for index in range(100):
+        table.add(f"sku-{index}", index)
+
+    print("Lookup 'sku-42':", table.lookup("sku-42"))
+
+    for index in range(90):
+        table.remove(f"sku-{index}")
+
+    print("Lookup 'sku-42' after removal:", table.lookup("sku-42"))
+    print("Lookup 'sku-95':", table.lookup("sku-95"))
+
+    stats = table.stats()
+    print("Capacity:", stats["capacity"])
+    print("Load factor:", round(stats["load_factor"], 2))
+    print("Probe histogram:", stats["probe_histogram"])
+
+    incremental = OpenAddressingHashTable(hash_function="fnv1a", incremental=True)
+    for index in range(13):
+        incremental.add(f"sku-{index}", index)
+
+    print("Rehashing in progress:", incremental.rehashing)
+    print("Entries:", len(incremental), "Lookup 'sku-3':", incremental.lookup("sku-3"))
+
+    # Migration pauses while iterating, so lookups in the loop are safe
+    iterated = OpenAddressingHashTable(incremental=True, rehash_batch=4)
+    for index in range(13):
+        iterated.add(f"sku-{index}", index)
+    seen = []
+    for key in iterated:
+        iterated.lookup(key)
+        seen.append(key)
+    print(f"Keys seen while looking up during a resize: {len(seen)} "
+          f"({len(set(seen))} unique)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+"""
+Main module demonstrating HashTable snapshots.
+"""
+
+import os
+import tempfile
+
+from hashtable import HashTable
+
+
+def main():
+    table = HashTable(hash_function="fnv1a")
+    table.add_many((f"SKU-{index:05d}", {"stock": index}) for index in range(1000))
+
+    path = os.path.join(tempfile.gettempdir(), "skus.htsnap")
+    table.save(path)
+
+    with HashTable.open(path) as snapshot:
+        print("Lookup 'SKU-00042':", snapshot.lookup("SKU-00042"))
+        print("Lookup 'SKU-99999':", snapshot.lookup("SKU-99999"))
+        print("Snapshot size:", snapshot.memory_usage()["bytes"], "bytes")
+
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,512 @@
+#!/usr/bin/python3
+"""
+open_addressing.py
+
+An open-addressing storage engine for HashTable.
+
+Instead of a dictionary of buckets, entries live in flat, parallel
+slot arrays (hashes, keys, values). Collisions are resolved with
+Robin Hood linear probing: while inserting, an entry that has
+travelled further from its home slot takes the place of one that is
+closer to home. This keeps probe sequences short and uniform, and
+lets lookups stop early as soon as they pass the point where the key
+would have been placed. Slots are chosen from the low bits of the
+hash, so the table defaults to the well-mixed "fnv1a" hash: with the
+character-sum hash of HashTable, similar keys such as SKUs share a
+handful of home slots and probing degrades to a linear scan.
+
+The table grows when the load factor exceeds ``max_load_factor`` and
+shrinks when it drops below ``min_load_factor``. Removal uses
+backward-shift deletion, so no tombstones are left behind.
+
+With ``incremental=True`` a resize does not rebuild the table at once.
+Like Redis, the old and new slot arrays are kept side by side and
+every add, lookup and remove migrates a few entries, so no single
+operation pays for rehashing the whole table. Like Redis "safe"
+iterators, migration pauses while an iteration over the table is in
+progress, so lookups (and value updates) inside a loop over the keys
+never make an entry move and be yielded twice.
+
+Time Complexity (expected): O(1) for add, lookup and remove
+Space Complexity: O(capacity)
+"""
+
+import sys
+
+from hashtable import HashTable
+
+
+class _SlotTable:
+    """Parallel slot arrays of one capacity, with Robin Hood probing."""
+
+    __slots__ = ("capacity", "mask", "hashes", "keys", "values", "size")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.hashes = [None] * capacity
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        self.size = 0
+
+    def find(self, hashed_key: int, key) -> int:
+        """
+        Locate the slot holding ``key``.
+
+        Returns:
+            int: The slot index, or -1 if the key is not present.
+        """
+        mask = self.mask
+        hashes = self.hashes
+        keys = self.keys
+        index = hashed_key & mask
+        distance = 0
+
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash is None:
+                return -1
+            # Robin Hood invariant: the key would have displaced this entry
+            if (index - slot_hash) & mask < distance:
+                return -1
+            if slot_hash == hashed_key and keys[index] == key:
+                return index
+            index = (index + 1) & mask
+            distance += 1
+
+    def insert(self, hashed_key: int, key, value) -> None:
+        """Insert or update an entry without checking the load factor."""
+        mask = self.mask
+        hashes = self.hashes
+        keys = self.keys
+        values = self.values
+        index = hashed_key & mask
+        distance = 0
+
+        while True:
+            slot_hash = hashes[index]
+
+            if slot_hash is None:
+                hashes[index] = hashed_key
+                keys[index] = key
+                values[index] = value
+                self.size += 1
+                return
+
+            if slot_hash == hashed_key and keys[index] == key:
+                values[index] = value
+                return
+
+            slot_distance = (index - slot_hash) & mask
+            if slot_distance < distance:
+                # Take from the rich: the resident entry is closer to home
+                hashes[index], hashed_key = hashed_key, slot_hash
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                distance = slot_distance
+
+            index = (index + 1) & mask
+            distance += 1
+
+    def delete_at(self, index: int) -> None:
+        """Empty a slot and shift the following probe run back by one."""
+        mask = self.mask
+        hashes = self.hashes
+        keys = self.keys
+        values = self.values
+        next_index = (index + 1) & mask
+
+        while (hashes[next_index] is not None
+               and (next_index - hashes[next_index]) & mask > 0):
+            hashes[index] = hashes[next_index]
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            index = next_index
+            next_index = (index + 1) & mask
+
+        hashes[index] = None
+        keys[index] = None
+        values[index] = None
+        self.size -= 1
+
+    def entries(self):
+        """Yield every (hash, key, value) triple in slot order."""
+        for hashed_key, key, value in zip(self.hashes, self.keys, self.values):
+            if hashed_key is not None:
+                yield hashed_key, key, value
+
+
+class OpenAddressingHashTable(HashTable):
+    """
+    A hash table using open addressing with Robin Hood probing.
+
+    Keeps the ``add`` / ``lookup`` / ``remove`` API of HashTable.
+    """
+
+    MIN_CAPACITY = 8
+
+    def __init__(self, capacity: int = MIN_CAPACITY,
+                 max_load_factor: float = 0.75,
+                 min_load_factor: float = 0.2,
+                 hash_function="fnv1a",
+                 incremental: bool = False,
+                 rehash_batch: int = 16):
+        """
+        Initialize an empty open-addressing table.
+
+        Args:
+            capacity (int): Initial number of slots (rounded up to a
+                power of two, at least MIN_CAPACITY).
+            max_load_factor (float): Grow when size / capacity exceeds this.
+            min_load_factor (float): Shrink when size / capacity drops below this.
+            hash_function: Hash function name or callable (see HashTable).
+            incremental (bool): Spread each resize over later operations.
+            rehash_batch (int): Entries migrated per operation while an
+                incremental resize is in progress.
+
+        Raises:
+            TypeError: If capacity is not an integer.
+            ValueError: If the load-factor thresholds or rehash_batch
+                are not valid.
+        """
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an integer")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        if not 0 <= min_load_factor < max_load_factor / 2:
+            raise ValueError(
+                "min_load_factor must be >= 0 and less than half of max_load_factor"
+            )
+        if rehash_batch < 1:
+            raise ValueError("rehash_batch must be >= 1")
+
+        super().__init__(hash_function)
+        # Slot arrays replace the dictionary of buckets
+        self.collection = None
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.incremental = incremental
+        self.rehash_batch = rehash_batch
+
+        self._table = _SlotTable(self._round_capacity(capacity))
+        # Slot arrays still being migrated by an incremental resize
+        self._old_table = None
+        self._migrate_index = 0
+        # Live iterations over the entries; migration waits for them
+        self._iterators = 0
+
+    @classmethod
+    def _round_capacity(cls, capacity: int) -> int:
+        """Round a capacity up to the next power of two."""
+        result = cls.MIN_CAPACITY
+        while result < capacity:
+            result *= 2
+        return result
+
+    @property
+    def _capacity(self) -> int:
+        return self._table.capacity
+
+    @property
+    def load_factor(self) -> float:
+        """Fraction of slots currently occupied."""
+        return len(self) / self._capacity
+
+    @property
+    def rehashing(self) -> bool:
+        """Whether an incremental resize is in progress."""
+        return self._old_table is not None
+
+    def _rehash_step(self) -> None:
+        """Move up to ``rehash_batch`` entries out of the old slot arrays."""
+        if self._iterators:
+            return
+
+        old = self._old_table
+        table = self._table
+        index = self._migrate_index
+        budget = self.rehash_batch
+
+        # Slots below the migration index are empty, and backward-shift
+        # deletion only moves entries onto the slot being emptied
+        while budget and old.size and index < old.capacity:
+            hashed_key = old.hashes[index]
+            if hashed_key is None:
+                index += 1
+                continue
+            table.insert(hashed_key, old.keys[index], old.values[index])
+            old.delete_at(index)
+            budget -= 1
+
+        self._migrate_index = index
+        if not old.size:
+            self._old_table = None
+
+    def _finish_rehash(self) -> None:
+        """Complete an incremental resize immediately."""
+        if self._old_table is not None:
+            for hashed_key, key, value in self._old_table.entries():
+                self._table.insert(hashed_key, key, value)
+            self._old_table = None
+
+    def _resize(self, capacity: int) -> None:
+        """Rebuild the slot arrays with a new capacity in one go."""
+        self._finish_rehash()
+        old = self._table
+        self._table = _SlotTable(capacity)
+
+        for hashed_key, key, value in old.entries():
+            self._table.insert(hashed_key, key, value)
+
+    def _start_resize(self, capacity: int) -> None:
+        """Resize now, or begin migrating incrementally if enabled."""
+        if not self.incremental:
+            self._resize(capacity)
+            return
+
+        self._finish_rehash()
+        self._old_table = self._table
+        self._table = _SlotTable(capacity)
+        self._migrate_index = 0
+
+    def _find(self, hashed_key: int, key):
+        """
+        Locate ``key`` in either set of slot arrays.
+
+        Returns:
+            tuple: (slot table, index), or (None, -1) if not present.
+        """
+        index = self._table.find(hashed_key, key)
+        if index != -1:
+            return self._table, index
+
+        if self._old_table is not None:
+            index = self._old_table.find(hashed_key, key)
+            if index != -1:
+                return self._old_table, index
+
+        return None, -1
+
+    def add(self, key, value) -> None:
+        """
+        Add or update a key-value pair in the hash table.
+
+        Args:
+            key (str): The key to store.
+            value: The value associated with the key.
+        """
+        if self._old_table is not None:
+            self._rehash_step()
+
+        if len(self) + 1 > self._capacity * self.max_load_factor:
+            self._start_resize(self._capacity * 2)
+
+        hashed_key = self.hash(key)
+
+        if self._old_table is not None:
+            index = self._old_table.find(hashed_key, key)
+            if index != -1:
+                if self._iterators:
+                    # Update in place so a live iteration sees the key once
+                    self._old_table.values[index] = value
+                    return
+                # Updates move the entry to the new slot arrays
+                self._old_table.delete_at(index)
+
+        self._table.insert(hashed_key, key, value)
+
+    def lookup(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            The value if the key exists, otherwise None.
+        """
+        if self._old_table is not None:
+            self._rehash_step()
+
+        table, index = self._find(self.hash(key), key)
+
+        if index == -1:
+            return None
+
+        return table.values[index]
+
+    def remove(self, key) -> None:
+        """
+        Remove a key-value pair from the hash table.
+
+        Args:
+            key (str): The key to remove.
+        """
+        if self._old_table is not None:
+            self._rehash_step()
+
+        table, index = self._find(self.hash(key), key)
+
+        if index == -1:
+            return
+
+        table.delete_at(index)
+
+        if self._old_table is None:
+            self._shrink_if_sparse()
+
+    def __len__(self) -> int:
+        size = self._table.size
+        if self._old_table is not None:
+            size += self._old_table.size
+        return size
+
+    def __contains__(self, key) -> bool:
+        return self._find(self.hash(key), key)[1] != -1
+
+    def _entries(self):
+        """Yield every stored (key, value) pair, in slot order."""
+        self._iterators += 1
+        try:
+            for table in (self._old_table, self._table):
+                if table is not None:
+                    for _, key, value in table.entries():
+                        yield key, value
+        finally:
+            self._iterators -= 1
+
+    def _reserve(self, count: int) -> None:
+        """Grow once so that ``count`` more entries fit under the load factor."""
+        self._finish_rehash()
+        needed = len(self) + count
+        capacity = self._capacity
+
+        while needed > capacity * self.max_load_factor:
+            capacity *= 2
+
+        if capacity != self._capacity:
+            self._resize(capacity)
+
+    def _shrink_if_sparse(self) -> None:
+        """Shrink once, as far as needed, when the load factor is too low."""
+        capacity = self._capacity
+
+        while (capacity > self.MIN_CAPACITY
+               and len(self) < capacity * self.min_load_factor):
+            capacity //= 2
+
+        if capacity != self._capacity:
+            self._start_resize(capacity)
+
+    def add_many(self, pairs) -> None:
+        """
+        Add or update many key-value pairs at once.
+
+        The table is resized at most once up front, then every pair is
+        hashed and inserted in a single loop.
+
+        Args:
+            pairs: Iterable of (key, value) pairs.
+        """
+        if not hasattr(pairs, "__len__"):
+            pairs = list(pairs)
+
+        self._reserve(len(pairs))
+
+        hash_function = self.hash_function
+        insert = self._table.insert
+
+        for key, value in pairs:
+            insert(hash_function(key), key, value)
+
+    def remove_many(self, keys) -> None:
+        """
+        Remove many keys at once, shrinking the table at most once.
+
+        Args:
+            keys: Iterable of keys to remove.
+        """
+        self._finish_rehash()
+
+        hash_function = self.hash_function
+        find = self._table.find
+        delete_at = self._table.delete_at
+
+        for key in keys:
+            index = find(hash_function(key), key)
+            if index != -1:
+                delete_at(index)
+
+        self._shrink_if_sparse()
+
+    def memory_usage(self) -> dict:
+        """
+        Measure the memory used by the table's own structures.
+
+        Key and value objects are excluded, since every layout shares them.
+
+        Returns:
+            dict: entries, bytes, and bytes_per_entry.
+        """
+        total = 0
+
+        for table in (self._old_table, self._table):
+            if table is not None:
+                total += (
+                    sys.getsizeof(table.hashes)
+                    + sys.getsizeof(table.keys)
+                    + sys.getsizeof(table.values)
+                    + sum(sys.getsizeof(hashed_key)
+                          for hashed_key in table.hashes if hashed_key is not None)
+                )
+
+        size = len(self)
+
+        return {
+            "entries": size,
+            "bytes": total,
+            "bytes_per_entry": total / size if size else 0.0,
+        }
+
+    def probe_histogram(self) -> dict:
+        """
+        Count how many entries sit at each distance from their home slot.
+
+        Returns:
+            dict: Mapping of probe distance to number of entries.
+        """
+        histogram = {}
+
+        for table in (self._old_table, self._table):
+            if table is None:
+                continue
+            for index, hashed_key in enumerate(table.hashes):
+                if hashed_key is not None:
+                    distance = (index - hashed_key) & table.mask
+                    histogram[distance] = histogram.get(distance, 0) + 1
+
+        return dict(sorted(histogram.items()))
+
+    def stats(self) -> dict:
+        """
+        Summarize the table's occupancy and probe lengths.
+
+        Returns:
+            dict: size, capacity, load_factor, rehashing, max_probe,
+            mean_probe and the probe_histogram.
+        """
+        histogram = self.probe_histogram()
+        total = sum(histogram.values())
+
+        return {
+            "size": len(self),
+            "capacity": self._capacity,
+            "load_factor": self.load_factor,
+            "rehashing": self.rehashing,
+            "max_probe": max(histogram, default=0),
+            "mean_probe": (
+                sum(distance * count for distance, count in histogram.items()) / total
+                if total else 0.0
+            ),
+            "probe_histogram": histogram,
+        }
@@ -0,0 +1,228 @@
+#!/usr/bin/python3
+"""
+snapshot.py
+
+A persistent, memory-mapped snapshot format for HashTable.
+
+Layout of a snapshot file (all integers little-endian):
+
+    header   magic (8 bytes), version (u32), reserved (u32),
+             entry count (u64), slot count (u64)
+    slots    slot count x (hash u64, record offset u64),
+             an open-addressing table probed linearly
+    records  key length (u32), value length (u32),
+             UTF-8 key bytes, pickled value bytes
+
+Opening a snapshot maps the file into memory and reads nothing else:
+each lookup probes the slot table and decodes only the record it
+needs. Because the mapping is read-only, every process opening the
+same file shares the same physical pages.
+
+Slots are always hashed with FNV-1a over the UTF-8 key so a snapshot
+can be read back regardless of the hash function of the saved table.
+
+Note:
+Values are stored with pickle, so only open snapshots you trust.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+
+from hash_functions import fnv1a_hash
+from hashtable import HashTable
+
+MAGIC = b"HTSNAP01"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQ")
+_SLOT = struct.Struct("<QQ")
+_RECORD = struct.Struct("<II")
+_EMPTY_SLOT = 0xFFFFFFFFFFFFFFFF
+
+
+def save_snapshot(table: HashTable, path: str) -> None:
+    """
+    Write every entry of a table to a snapshot file.
+
+    The file is written next to ``path`` and moved into place, so
+    readers never see a partially written snapshot.
+
+    Args:
+        table (HashTable): The table to save.
+        path (str): Destination file path.
+
+    Raises:
+        TypeError: If a key is not a string.
+    """
+    records = []
+    for key, value in table._entries():
+        if not isinstance(key, str):
+            raise TypeError("Snapshot keys must be strings")
+        records.append((key.encode("utf-8"), pickle.dumps(value)))
+
+    capacity = 8
+    while len(records) * 2 > capacity:
+        capacity *= 2
+    mask = capacity - 1
+
+    slots = [(0, _EMPTY_SLOT)] * capacity
+    offset = _HEADER.size + capacity * _SLOT.size
+
+    for key_bytes, value_bytes in records:
+        hashed_key = fnv1a_hash(key_bytes)
+        slot = hashed_key & mask
+        while slots[slot][1] != _EMPTY_SLOT:
+            slot = (slot + 1) & mask
+        slots[slot] = (hashed_key, offset)
+        offset += _RECORD.size + len(key_bytes) + len(value_bytes)
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, 0, len(records), capacity))
+        for hashed_key, record_offset in slots:
+            file.write(_SLOT.pack(hashed_key, record_offset))
+        for key_bytes, value_bytes in records:
+            file.write(_RECORD.pack(len(key_bytes), len(value_bytes)))
+            file.write(key_bytes)
+            file.write(value_bytes)
+
+    os.replace(temporary_path, path)
+
+
+class MappedHashTable(HashTable):
+    """
+    A read-only HashTable backed by a memory-mapped snapshot file.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file for lookups.
+
+        Args:
+            path (str): Path of a file written by save_snapshot().
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version.
+        """
+        super().__init__("fnv1a")
+        # The mapped file replaces the dictionary of buckets
+        self.collection = None
+        self.path = path
+
+        with open(path, "rb") as file:
+            self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._buffer) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a HashTable snapshot")
+
+        magic, version, _, self._size, capacity = _HEADER.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} HashTable snapshot")
+
+        self._mask = capacity - 1
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        self._buffer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _read_record(self, offset: int):
+        """Return the (key bytes, value bytes) slices of a record."""
+        key_length, value_length = _RECORD.unpack_from(self._buffer, offset)
+        key_start = offset + _RECORD.size
+        value_start = key_start + key_length
+        return (
+            self._buffer[key_start:value_start],
+            self._buffer[value_start:value_start + value_length],
+        )
+
+    def _find(self, key) -> int:
+        """
+        Probe the slot table for ``key``.
+
+        Returns:
+            int: The record offset, or -1 if the key is not present.
+        """
+        if not isinstance(key, str):
+            return -1
+
+        key_bytes = key.encode("utf-8")
+        hashed_key = self.hash(key_bytes)
+        mask = self._mask
+        slot = hashed_key & mask
+
+        while True:
+            slot_hash, offset = _SLOT.unpack_from(
+                self._buffer, _HEADER.size + slot * _SLOT.size
+            )
+            if offset == _EMPTY_SLOT:
+                return -1
+            if slot_hash == hashed_key and self._read_record(offset)[0] == key_bytes:
+                return offset
+            slot = (slot + 1) & mask
+
+    def lookup(self, key):
+        """
+        Retrieve the value associated with a given key.
+
+        Args:
+            key (str): The key to look up.
+
+        Returns:
+            The value if the key exists, otherwise None.
+        """
+        offset = self._find(key)
+
+        if offset == -1:
+            return None
+
+        return pickle.loads(self._read_record(offset)[1])
+
+    def __contains__(self, key) -> bool:
+        return self._find(key) != -1
+
+    def _entries(self):
+        """Yield every (key, value) pair stored in the snapshot."""
+        offset = _HEADER.size + (self._mask + 1) * _SLOT.size
+
+        for _ in range(self._size):
+            key_bytes, value_bytes = self._read_record(offset)
+            yield key_bytes.decode("utf-8"), pickle.loads(value_bytes)
+            offset += _RECORD.size + len(key_bytes) + len(value_bytes)
+
+    def add(self, key, value) -> None:
+        raise TypeError("Snapshot tables are read-only")
+
+    def remove(self, key) -> None:
+        raise TypeError("Snapshot tables are read-only")
+
+    def add_many(self, pairs) -> None:
+        raise TypeError("Snapshot tables are read-only")
+
+    def remove_many(self, keys) -> None:
+        raise TypeError("Snapshot tables are read-only")
+
+    def memory_usage(self) -> dict:
+        """
+        Report the size of the mapped file; pages are loaded on demand
+        and shared between processes.
+
+        Returns:
+            dict: entries, bytes, and bytes_per_entry.
+        """
+        total = len(self._buffer)
+
+        return {
+            "entries": self._size,
+            "bytes": total,
+            "bytes_per_entry": total / self._size if self._size else 0.0,
+        }
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+benchmark_linked_lists.py
+
+Compares the node-per-element LinkedList with the UnrolledLinkedList
+on append, traversal and removal.
+"""
+
+import random
+import time
+
+from linked_list import LinkedList
+from unrolled_linked_list import UnrolledLinkedList
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def _traverse_linked_list(linked_list):
+    total = 0
+    node = linked_list.head
+    while node is not None:
+        total += node.element
+        node = node.next
+    return total
+
+
+def benchmark(size, removals):
+    """
+    Time append, traversal and removal for both list types.
+
+    Args:
+        size (int): Number of elements to append.
+        removals (int): Number of random values to remove.
+
+    Returns:
+        dict: Seconds per operation, keyed by list type then operation.
+    """
+    to_remove = random.sample(range(size), removals)
+    results = {}
+
+    for name, factory, traverse in (
+        ("LinkedList", LinkedList, _traverse_linked_list),
+        ("UnrolledLinkedList", UnrolledLinkedList, sum),
+    ):
+        linked_list = factory()
+
+        def append_all():
+            for element in range(size):
+                linked_list.add(element)
+
+        def remove_all():
+            for element in to_remove:
+                linked_list.remove(element)
+
+        results[name] = {
+            "append": _timed(append_all),
+            "traverse": _timed(lambda: traverse(linked_list)),
+            "remove": _timed(remove_all),
+        }
+
+    return results
+
+
+def main():
+    size = 200000
+    removals = 200
+
+    print(f"{size} elements, {removals} removals")
+    for name, timings in benchmark(size, removals).items():
+        row = ", ".join(f"{operation} {seconds:.4f}s" for operation, seconds in timings.items())
+        print(f"{name:>20}: {row}")
+
+
+if __name__ == "__main__":
+    main()
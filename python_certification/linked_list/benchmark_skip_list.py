@@ -0,0 +1,75 @@
+#!/usr/bin/python3
+"""
+benchmark_skip_list.py
+
+Compares SkipList with a plain Python list kept sorted through
+bisect.insort, for insertion, search and removal.
+
+Note:
+bisect.insort finds the position in O(log n) but shifts the tail of
+the list in O(n); that shift is a fast memmove, so the list wins for
+small sizes and the skip list catches up as n grows.
+"""
+
+import bisect
+import random
+import time
+
+from skip_list import SkipList
+
+
+def _timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def benchmark(size):
+    """
+    Time inserting, searching and removing ``size`` random values.
+
+    Args:
+        size (int): Number of values to use.
+
+    Returns:
+        dict: Seconds per operation, keyed by container then operation.
+    """
+    values = [random.random() for _ in range(size)]
+    removal_order = random.sample(values, len(values))
+
+    skip_list = SkipList()
+    sorted_list = []
+
+    def bisect_contains(value):
+        index = bisect.bisect_left(sorted_list, value)
+        return index < len(sorted_list) and sorted_list[index] == value
+
+    def bisect_remove(value):
+        index = bisect.bisect_left(sorted_list, value)
+        if index < len(sorted_list) and sorted_list[index] == value:
+            del sorted_list[index]
+
+    return {
+        "SkipList": {
+            "insert": _timed(lambda: [skip_list.add(value) for value in values]),
+            "search": _timed(lambda: [value in skip_list for value in values]),
+            "remove": _timed(lambda: [skip_list.remove(value) for value in removal_order]),
+        },
+        "bisect list": {
+            "insert": _timed(lambda: [bisect.insort(sorted_list, value) for value in values]),
+            "search": _timed(lambda: [bisect_contains(value) for value in values]),
+            "remove": _timed(lambda: [bisect_remove(value) for value in removal_order]),
+        },
+    }
+
+
+def main():
+    for size in (1000, 10000, 100000):
+        print(f"{size} elements")
+        for name, timings in benchmark(size).items():
+            row = ", ".join(f"{operation} {seconds:.4f}s" for operation, seconds in timings.items())
+            print(f"{name:>14}: {row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+"""
+ConcurrentQueue Module
+
+This module provides a thread-safe FIFO queue built from LinkedList
+nodes, using the two-lock design of Michael and Scott.
+
+The queue always holds a dummy node at the head:
+- Producers only take the tail lock to link a node after the tail
+- Consumers only take the head lock to advance the head past the dummy,
+  the first real node becoming the new dummy
+
+Because the head and tail are never touched under the same lock,
+producers and consumers do not contend with each other while the queue
+holds items. A consumer finding the queue empty waits on a condition of
+the head lock; only then does a producer take the head lock, to wake
+it. Consumers register as waiters before checking for a node and
+producers link the node before checking for waiters, so a wake-up is
+never missed.
+"""
+
+import threading
+from queue import Empty
+
+from linked_list import LinkedList
+
+
+class ConcurrentQueue:
+    """A FIFO queue with separate producer and consumer locks."""
+
+    def __init__(self):
+        """
+        Initialize an empty queue.
+        """
+        dummy = LinkedList.Node(None)
+        self._head = dummy
+        self._tail = dummy
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        # Consumers blocked on an empty queue, guarded by the head lock
+        self._waiters = 0
+
+    def put(self, element):
+        """
+        Add an element to the back of the queue.
+
+        Args:
+            element: The value to enqueue.
+        """
+        node = LinkedList.Node(element)
+
+        with self._tail_lock:
+            self._tail.next = node
+            self._tail = node
+
+        # The node is linked before waiters are checked (see module docstring)
+        if self._waiters:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def _has_next(self):
+        return self._head.next is not None
+
+    def get(self, block=True, timeout=None):
+        """
+        Remove and return the element at the front of the queue.
+
+        Args:
+            block (bool): Wait for an element if the queue is empty.
+            timeout (float | None): Maximum seconds to wait when blocking;
+                None waits indefinitely.
+
+        Returns:
+            The front element.
+
+        Raises:
+            queue.Empty: If no element became available.
+        """
+        with self._not_empty:
+            if block and self._head.next is None:
+                self._waiters += 1
+                try:
+                    self._not_empty.wait_for(self._has_next, timeout)
+                finally:
+                    self._waiters -= 1
+
+            node = self._head.next
+            if node is None:
+                raise Empty
+
+            element = node.element
+            # The dequeued node becomes the new dummy
+            node.element = None
+            self._head = node
+            return element
+
+    def drain(self, max_items=None):
+        """
+        Remove and return up to ``max_items`` elements without blocking.
+
+        Args:
+            max_items (int | None): Maximum number of elements to take;
+                None takes everything currently available.
+
+        Returns:
+            list: The removed elements, in FIFO order (possibly empty).
+        """
+        elements = []
+        with self._head_lock:
+            node = self._head
+            while (max_items is None or len(elements) < max_items) \
+                    and node.next is not None:
+                node = node.next
+                elements.append(node.element)
+            node.element = None
+            self._head = node
+
+        return elements
+
+    def empty(self):
+        """
+        Check whether the queue currently appears empty.
+
+        Returns:
+            bool: True if no element is linked after the head; the answer
+            may be stale as soon as it is returned.
+        """
+        return self._head.next is None
@@ -2,12 +2,24 @@
 """
 LinkedList Module
 
-This module provides a simple implementation of a singly linked list.
+This module provides an implementation of a doubly linked list.
 It supports basic operations such as:
 - Checking if the list is empty
-- Adding elements to the end of the list
-- Removing elements from the list
+- Adding elements to either end of the list in O(1)
+- Popping elements from either end of the list in O(1)
+- Removing elements by value, or in O(1) through a node handle
 - Tracking the length of the list
+- Building from, splicing in, and iterating like a Python sequence
+
+The list keeps both a head and a tail pointer. Appending returns the
+new node, which can later be passed to ``remove_node`` to unlink it
+without scanning, making the list suitable as the backbone of queues
+and LRU lists.
+
+With ``indexed=True`` the list also keeps a hash index from each value
+to its nodes (duplicates allowed), so ``remove``, ``in`` and ``find``
+run in O(1) expected time instead of scanning. Indexed lists require
+hashable elements.
 
 The implementation is intended for educational purposes and demonstrates
 core data structure concepts such as nodes, pointers, and traversal.
@@ -15,19 +27,22 @@ core data structure concepts such as nodes, pointers, and traversal.
 
 
 class LinkedList:
-    """A singly linked list implementation."""
+    """A doubly linked list implementation."""
+
 
-    
     class Node:
         """
         Represents a single node in the linked list.
 
         Attributes:
             element: The value stored in the node.
+            prev (Node | None): Reference to the previous node in the list.
             next (Node | None): Reference to the next node in the list.
         """
 
-        
+        __slots__ = ("element", "prev", "next", "owner")
+
+
         def __init__(self, element):
             """
             Initialize a new node.
@@ -36,17 +51,43 @@ class LinkedList:
                 element: The value to be stored in the node.
             """
             self.element = element
+            self.prev = None
             self.next = None
+            # The list this node is linked into, used to validate handles
+            self.owner = None
 
-    
-    def __init__(self):
+
+    def __init__(self, indexed=False):
         """
         Initialize an empty linked list.
+
+        Args:
+            indexed (bool): Keep a value-to-node index for O(1)
+                membership tests and removal by value.
         """
         self.length = 0
         self.head = None
+        self.tail = None
+        # Maps each element to its nodes, in list order
+        self._index = {} if indexed else None
+
+    @classmethod
+    def from_iterable(cls, iterable, indexed=False):
+        """
+        Build a linked list from any iterable in a single pass.
+
+        Args:
+            iterable: The elements, in order.
+            indexed (bool): Keep a value-to-node index (see __init__).
+
+        Returns:
+            LinkedList: A new list holding the elements.
+        """
+        linked_list = cls(indexed=indexed)
+        linked_list.extend(iterable)
+        return linked_list
+
 
-    
     def is_empty(self):
         """
         Check whether the linked list is empty.
@@ -56,26 +97,153 @@ class LinkedList:
         """
         return self.length == 0
 
-    
-    def add(self, element):
+
+    def append(self, element):
         """
-        Add an element to the end of the linked list.
+        Add an element to the end of the linked list in O(1).
 
         Args:
             element: The value to be added to the list.
+
+        Returns:
+            Node: A handle to the new node, usable with remove_node().
+
+        Raises:
+            TypeError: If the list is indexed and the element is not
+                hashable; the list is left unchanged.
         """
         node = self.Node(element)
+        node.owner = self
+
+        # Index first, so an unhashable element fails before linking
+        if self._index is not None:
+            self._index.setdefault(element, []).append(node)
 
         if self.is_empty():
             self.head = node
         else:
-            current_node = self.head
-            while current_node.next is not None:
-                current_node = current_node.next
-            current_node.next = node
+            node.prev = self.tail
+            self.tail.next = node
+
+        self.tail = node
+        self.length += 1
+
+        return node
+
+    def appendleft(self, element):
+        """
+        Add an element to the start of the linked list in O(1).
+
+        Args:
+            element: The value to be added to the list.
+
+        Returns:
+            Node: A handle to the new node, usable with remove_node().
+
+        Raises:
+            TypeError: If the list is indexed and the element is not
+                hashable; the list is left unchanged.
+        """
+        node = self.Node(element)
+        node.owner = self
+
+        # Index first, so an unhashable element fails before linking
+        if self._index is not None:
+            self._index.setdefault(element, []).insert(0, node)
+
+        if self.is_empty():
+            self.tail = node
+        else:
+            node.next = self.head
+            self.head.prev = node
 
+        self.head = node
         self.length += 1
 
+        return node
+
+    def add(self, element):
+        """
+        Add an element to the end of the linked list.
+
+        Kept for compatibility; equivalent to append().
+
+        Args:
+            element: The value to be added to the list.
+
+        Returns:
+            Node: A handle to the new node, usable with remove_node().
+        """
+        return self.append(element)
+
+    def _unlink(self, node):
+        """Detach a node from the list in O(1)."""
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+
+        node.prev = None
+        node.next = None
+        node.owner = None
+        self.length -= 1
+
+        if self._index is not None:
+            nodes = self._index[node.element]
+            if nodes[-1] is node:
+                nodes.pop()
+            else:
+                nodes.remove(node)
+            if not nodes:
+                del self._index[node.element]
+
+    def pop(self):
+        """
+        Remove and return the last element in O(1).
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.is_empty():
+            raise IndexError("pop from an empty list")
+
+        node = self.tail
+        self._unlink(node)
+        return node.element
+
+    def popleft(self):
+        """
+        Remove and return the first element in O(1).
+
+        Raises:
+            IndexError: If the list is empty.
+        """
+        if self.is_empty():
+            raise IndexError("pop from an empty list")
+
+        node = self.head
+        self._unlink(node)
+        return node.element
+
+    def remove_node(self, node):
+        """
+        Remove a node, previously returned by an add method, in O(1).
+
+        Args:
+            node (Node): The handle of the node to remove.
+
+        Raises:
+            ValueError: If the node is not linked into this list.
+        """
+        if node.owner is not self:
+            raise ValueError("node does not belong to this list")
+
+        self._unlink(node)
 
     def remove(self, element):
         """
@@ -87,21 +255,200 @@ class LinkedList:
         Notes:
             - If the element does not exist, the list remains unchanged.
             - Only the first matching element is removed.
+            - Without an index this scans from the head; prefer
+              remove_node() when a handle is available.
+        """
+        current_node = self.find(element)
+
+        if current_node is None:
+            return  # Element not found
+
+        self._unlink(current_node)
+
+    def find(self, element):
+        """
+        Return the node of the first occurrence of an element.
+
+        Args:
+            element: The value to look for.
+
+        Returns:
+            Node | None: The node handle, or None if not found.
         """
-        previous_node = None
+        if self._index is not None:
+            nodes = self._index.get(element)
+            return nodes[0] if nodes else None
+
         current_node = self.head
 
         while current_node is not None and current_node.element != element:
-            previous_node = current_node
             current_node = current_node.next
 
-        if current_node is None:
-            return  # Element not found
+        return current_node
+
+    def __contains__(self, element):
+        return self.find(element) is not None
+
+    def index(self, element):
+        """
+        Return the position of the first occurrence of an element.
+
+        With an index the node is found in O(1), but counting its
+        position still walks back to the head.
+
+        Args:
+            element: The value to look for.
 
-        if previous_node is not None:
-            previous_node.next = current_node.next
+        Returns:
+            int: The zero-based position of the element.
+
+        Raises:
+            ValueError: If the element is not in the list.
+        """
+        node = self.find(element)
+
+        if node is None:
+            raise ValueError(f"{element!r} is not in the list")
+
+        position = 0
+        while node.prev is not None:
+            node = node.prev
+            position += 1
+
+        return position
+
+    def extend(self, iterable):
+        """
+        Append every element of an iterable.
+
+        The new nodes are chained together first and then spliced onto
+        the tail in one step, rather than going through append() for
+        each element.
+
+        Args:
+            iterable: The elements to add, in order.
+
+        Raises:
+            TypeError: If the list is indexed and an element is not
+                hashable; no element of the batch is added.
+        """
+        if iterable is self:
+            iterable = self.to_list()
+
+        Node = self.Node
+        indexed = self._index is not None
+        first = last = None
+        count = 0
+
+        for element in iterable:
+            if indexed:
+                # Fail before anything is spliced in
+                hash(element)
+            node = Node(element)
+            node.owner = self
+            if last is None:
+                first = node
+            else:
+                node.prev = last
+                last.next = node
+            last = node
+            count += 1
+
+        if first is None:
+            return
+
+        if self.is_empty():
+            self.head = first
         else:
-            self.head = current_node.next
+            first.prev = self.tail
+            self.tail.next = first
 
-        self.length -= 1
+        self.tail = last
+        self.length += count
+
+        if indexed:
+            index = self._index
+            node = first
+            while node is not None:
+                index.setdefault(node.element, []).append(node)
+                node = node.next
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield node.element
+            node = node.next
+
+    def __reversed__(self):
+        node = self.tail
+        while node is not None:
+            yield node.element
+            node = node.prev
+
+    def _node_at(self, position):
+        """Return the node at a valid position, walking from the nearer end."""
+        if position <= self.length // 2:
+            node = self.head
+            for _ in range(position):
+                node = node.next
+        else:
+            node = self.tail
+            for _ in range(self.length - 1 - position):
+                node = node.prev
+        return node
+
+    def __getitem__(self, position):
+        """
+        Return the element at a position, or a new list for a slice.
+
+        Args:
+            position (int | slice): Zero-based position (negative values
+                count from the end) or a slice.
+
+        Returns:
+            The element, or a LinkedList for a slice.
+
+        Raises:
+            TypeError: If position is neither an integer nor a slice.
+            IndexError: If an integer position is out of range.
+        """
+        if isinstance(position, slice):
+            start, stop, step = position.indices(self.length)
+            count = len(range(start, stop, step))
+            result = type(self)(indexed=self._index is not None)
+
+            if count:
+                node = self._node_at(start)
+                elements = []
+                for _ in range(count - 1):
+                    elements.append(node.element)
+                    for _ in range(abs(step)):
+                        node = node.next if step > 0 else node.prev
+                elements.append(node.element)
+                result.extend(elements)
+
+            return result
+
+        if not isinstance(position, int):
+            raise TypeError("list indices must be integers or slices")
+        if position < 0:
+            position += self.length
+        if not 0 <= position < self.length:
+            raise IndexError("list index out of range")
+
+        return self._node_at(position).element
+
+    def to_list(self):
+        """
+        Return the elements as a Python list.
+
+        Returns:
+            list: The elements, in order.
+        """
+        return list(self)
 
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_list()!r})"
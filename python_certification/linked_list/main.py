@@ -20,6 +20,38 @@ def main():
     my_list.remove(1)
     print("List length after removing 1:", my_list.length)
 
+    handle = my_list.append(3)
+    my_list.appendleft(0)
+    my_list.remove_node(handle)
+    print("List length after removing node 3:", my_list.length)
+
+    print("Popped from the right:", my_list.pop())
+    print("Popped from the left:", my_list.popleft())
+    print("Is list empty?", my_list.is_empty())
+
+    indexed_list = LinkedList(indexed=True)
+    for element in ["a", "b", "c", "b"]:
+        indexed_list.append(element)
+
+    print("\nContains 'b'?", "b" in indexed_list)
+    print("Index of 'c':", indexed_list.index("c"))
+    indexed_list.remove("b")
+    print("Index of 'b' after removing the first one:", indexed_list.index("b"))
+
+    # Unhashable elements are rejected before the list is changed
+    try:
+        indexed_list.extend(["d", ["not", "hashable"]])
+    except TypeError as error:
+        print("Rejected batch:", error, "| length still", len(indexed_list))
+
+    numbers = LinkedList.from_iterable(range(5))
+    numbers.extend([5, 6, 7])
+
+    print("\nElements:", numbers.to_list())
+    print("Reversed:", list(reversed(numbers)))
+    print("Element at -1:", numbers[-1])
+    print("Every other element:", numbers[::2])
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,40 @@
+#!/usr/bin/python3
+"""
+Demo script for the ConcurrentQueue module.
+"""
+
+import threading
+from queue import Empty
+
+from concurrent_queue import ConcurrentQueue
+
+
+def main():
+    work = ConcurrentQueue()
+    results = []
+
+    def producer(start):
+        for number in range(start, start + 5):
+            work.put(number)
+
+    producers = [threading.Thread(target=producer, args=(start,)) for start in (0, 100)]
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+
+    print("First item:", work.get(timeout=1))
+    print("Drained batch:", sorted(work.drain(max_items=4)))
+
+    while True:
+        try:
+            results.append(work.get(timeout=0.1))
+        except Empty:
+            break
+
+    print("Remaining items:", sorted(results))
+    print("Queue empty?", work.empty())
+
+
+if __name__ == "__main__":
+    main()
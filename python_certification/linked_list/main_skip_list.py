@@ -0,0 +1,23 @@
+#!/usr/bin/python3
+"""
+Demo script for the SkipList module.
+"""
+
+from skip_list import SkipList
+
+
+def main():
+    scores = SkipList([42, 7, 19, 88, 7, 63])
+
+    print("Sorted scores:", list(scores))
+    print("Contains 19?", 19 in scores)
+    print("Rank of 50:", scores.rank(50))
+    print("Median score:", scores[len(scores) // 2])
+    print("Scores in [10, 70]:", list(scores.irange(10, 70)))
+
+    scores.remove(7)
+    print("After removing one 7:", list(scores))
+
+
+if __name__ == "__main__":
+    main()
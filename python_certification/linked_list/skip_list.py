@@ -0,0 +1,264 @@
+#!/usr/bin/python3
+"""
+SkipList Module
+
+This module provides a skip list: a sorted linked list whose nodes
+carry a tower of forward pointers. Level 0 links every node in order;
+each higher level links a random subset (about half of the level
+below), so a search can skip ahead in large strides and then drop
+down a level.
+
+Each forward pointer also records its width (how many elements it
+skips), which makes the list indexable: positional access and rank
+queries take O(log n) as well.
+
+Duplicates are allowed; equal elements keep their insertion order.
+
+Time Complexity (expected):
+- add / remove / search: O(log n)
+- rank / positional access: O(log n)
+- range iteration: O(log n + k) for k returned elements
+"""
+
+import random
+
+
+class SkipList:
+    """A sorted, indexable skip list."""
+
+    MAX_LEVEL = 32
+
+
+    class Node:
+        """
+        Represents a single node in the skip list.
+
+        Attributes:
+            element: The value stored in the node.
+            next (list): Forward pointer per level (Node | None).
+            width (list): Number of level-0 steps each pointer spans.
+        """
+
+        __slots__ = ("element", "next", "width")
+
+
+        def __init__(self, element, level):
+            """
+            Initialize a new node.
+
+            Args:
+                element: The value to be stored in the node.
+                level (int): Height of the node's pointer tower.
+            """
+            self.element = element
+            self.next = [None] * level
+            self.width = [1] * level
+
+
+    def __init__(self, iterable=(), seed=None):
+        """
+        Initialize a skip list, optionally filled from an iterable.
+
+        Args:
+            iterable: Elements to add.
+            seed: Seed for the level generator, for reproducible shapes.
+        """
+        self.length = 0
+        self.head = self.Node(None, self.MAX_LEVEL)
+        self._levels = 1
+        self._random = random.Random(seed)
+
+        for element in iterable:
+            self.add(element)
+
+
+    def is_empty(self):
+        """
+        Check whether the skip list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.length == 0
+
+    def _random_level(self):
+        """Pick a tower height with P(level > k) = 1 / 2**k."""
+        level = 1
+        while level < self.MAX_LEVEL and self._random.random() < 0.5:
+            level += 1
+        return level
+
+    def _search(self, element, inclusive):
+        """
+        Find, on every level, the last node before the insertion point.
+
+        Args:
+            element: The value to locate.
+            inclusive (bool): Step past nodes equal to ``element`` too.
+
+        Returns:
+            tuple: (chain of predecessor nodes per level,
+            level-0 position of each predecessor).
+        """
+        chain = [self.head] * self.MAX_LEVEL
+        positions = [0] * self.MAX_LEVEL
+        node = self.head
+        position = 0
+
+        for level in reversed(range(self._levels)):
+            following = node.next[level]
+            while following is not None and (
+                following.element <= element if inclusive else following.element < element
+            ):
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+            chain[level] = node
+            positions[level] = position
+
+        return chain, positions
+
+    def add(self, element):
+        """
+        Insert an element at its sorted position.
+
+        Args:
+            element: The value to be added; must be comparable with the
+                elements already stored.
+        """
+        chain, positions = self._search(element, inclusive=True)
+        level = self._random_level()
+
+        if level > self._levels:
+            for new_level in range(self._levels, level):
+                # Unused head pointers span the whole list
+                self.head.width[new_level] = self.length + 1
+            self._levels = level
+
+        node = self.Node(element, level)
+        position = positions[0] + 1
+
+        for current in range(level):
+            previous = chain[current]
+            node.next[current] = previous.next[current]
+            previous.next[current] = node
+            skipped = position - positions[current]
+            node.width[current] = previous.width[current] - skipped + 1
+            previous.width[current] = skipped
+
+        for current in range(level, self._levels):
+            chain[current].width[current] += 1
+
+        self.length += 1
+
+    def remove(self, element):
+        """
+        Remove the first occurrence of an element.
+
+        Args:
+            element: The value to be removed.
+
+        Notes:
+            - If the element does not exist, the list remains unchanged.
+        """
+        chain, _ = self._search(element, inclusive=False)
+        node = chain[0].next[0]
+
+        if node is None or node.element != element:
+            return  # Element not found
+
+        for level in range(self._levels):
+            previous = chain[level]
+            if previous.next[level] is node:
+                previous.width[level] += node.width[level] - 1
+                previous.next[level] = node.next[level]
+            else:
+                previous.width[level] -= 1
+
+        self.length -= 1
+
+    def __contains__(self, element):
+        chain, _ = self._search(element, inclusive=False)
+        node = chain[0].next[0]
+        return node is not None and node.element == element
+
+    def rank(self, element):
+        """
+        Count the elements strictly smaller than a value.
+
+        Args:
+            element: The value to rank.
+
+        Returns:
+            int: The position at which ``element`` would be inserted
+            before any equal elements.
+        """
+        _, positions = self._search(element, inclusive=False)
+        return positions[0]
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        """
+        Return the element at a sorted position in O(log n).
+
+        Args:
+            index (int): Zero-based position; negative values count
+                from the end.
+
+        Raises:
+            TypeError: If index is not an integer.
+            IndexError: If index is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError("index must be an integer")
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("skip list index out of range")
+
+        remaining = index + 1
+        node = self.head
+
+        for level in reversed(range(self._levels)):
+            while node.width[level] <= remaining and node.next[level] is not None:
+                remaining -= node.width[level]
+                node = node.next[level]
+
+        return node.element
+
+    def __iter__(self):
+        node = self.head.next[0]
+        while node is not None:
+            yield node.element
+            node = node.next[0]
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Iterate over the elements between two bounds, in sorted order.
+
+        Args:
+            minimum: Lower bound, or None for no lower bound.
+            maximum: Upper bound, or None for no upper bound.
+            inclusive (tuple): Whether each bound is included.
+
+        Yields:
+            The elements within the bounds.
+        """
+        if minimum is None:
+            node = self.head.next[0]
+        else:
+            chain, _ = self._search(minimum, inclusive=not inclusive[0])
+            node = chain[0].next[0]
+
+        while node is not None:
+            if maximum is not None and (
+                node.element > maximum if inclusive[1] else node.element >= maximum
+            ):
+                return
+            yield node.element
+            node = node.next[0]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
@@ -0,0 +1,179 @@
+#!/usr/bin/python3
+"""
+UnrolledLinkedList Module
+
+This module provides an unrolled linked list: a linked list whose nodes
+each hold a small array of up to ``node_capacity`` elements instead of
+a single element.
+
+Compared with one node per element:
+- Far fewer Python objects, so less memory per element
+- Traversal walks arrays instead of chasing a pointer per element
+- Indexed access skips whole nodes at a time
+
+It offers the same add / remove / is_empty / length API as LinkedList,
+plus iteration and indexed access.
+
+Time Complexity:
+- add: O(1)
+- remove: O(n / node_capacity + node_capacity)
+- indexed access: O(n / node_capacity)
+"""
+
+
+class UnrolledLinkedList:
+    """A linked list of fixed-capacity element arrays."""
+
+
+    class Node:
+        """
+        Represents a single node in the unrolled linked list.
+
+        Attributes:
+            elements (list): Up to node_capacity stored values.
+            next (Node | None): Reference to the next node in the list.
+        """
+
+        __slots__ = ("elements", "next")
+
+
+        def __init__(self):
+            """Initialize an empty node."""
+            self.elements = []
+            self.next = None
+
+
+    def __init__(self, node_capacity=64):
+        """
+        Initialize an empty unrolled linked list.
+
+        Args:
+            node_capacity (int): Maximum number of elements per node.
+
+        Raises:
+            TypeError: If node_capacity is not an integer.
+            ValueError: If node_capacity < 2.
+        """
+        if not isinstance(node_capacity, int):
+            raise TypeError("node_capacity must be an integer")
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be >= 2")
+
+        self.node_capacity = node_capacity
+        self.length = 0
+        self.head = None
+        self.tail = None
+
+
+    def is_empty(self):
+        """
+        Check whether the list is empty.
+
+        Returns:
+            bool: True if the list is empty, False otherwise.
+        """
+        return self.length == 0
+
+
+    def add(self, element):
+        """
+        Add an element to the end of the list.
+
+        Args:
+            element: The value to be added to the list.
+        """
+        if self.tail is None or len(self.tail.elements) == self.node_capacity:
+            node = self.Node()
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+
+        self.tail.elements.append(element)
+        self.length += 1
+
+
+    def remove(self, element):
+        """
+        Remove the first occurrence of an element from the list.
+
+        A node left less than half full borrows the elements of its
+        successor when they fit, so nodes stay densely packed.
+
+        Args:
+            element: The value to be removed.
+
+        Notes:
+            - If the element does not exist, the list remains unchanged.
+            - Only the first matching element is removed.
+        """
+        previous_node = None
+        current_node = self.head
+
+        while current_node is not None and element not in current_node.elements:
+            previous_node = current_node
+            current_node = current_node.next
+
+        if current_node is None:
+            return  # Element not found
+
+        current_node.elements.remove(element)
+        self.length -= 1
+
+        if not current_node.elements:
+            self._unlink(previous_node, current_node)
+            return
+
+        following = current_node.next
+        if (following is not None
+                and len(current_node.elements) < self.node_capacity // 2
+                and len(current_node.elements) + len(following.elements)
+                <= self.node_capacity):
+            current_node.elements.extend(following.elements)
+            self._unlink(current_node, following)
+
+    def _unlink(self, previous_node, node):
+        """Detach a node given its predecessor (None for the head)."""
+        if previous_node is None:
+            self.head = node.next
+        else:
+            previous_node.next = node.next
+
+        if self.tail is node:
+            self.tail = previous_node
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        node = self.head
+        while node is not None:
+            yield from node.elements
+            node = node.next
+
+    def __getitem__(self, index):
+        """
+        Return the element at a position, skipping whole nodes.
+
+        Args:
+            index (int): Zero-based position; negative values count
+                from the end.
+
+        Raises:
+            TypeError: If index is not an integer.
+            IndexError: If index is out of range.
+        """
+        if not isinstance(index, int):
+            raise TypeError("index must be an integer")
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("list index out of range")
+
+        node = self.head
+        while index >= len(node.elements):
+            index -= len(node.elements)
+            node = node.next
+
+        return node.elements[index]
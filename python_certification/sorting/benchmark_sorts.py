@@ -0,0 +1,283 @@
+#!/usr/bin/python3
+"""
+benchmark_sorts.py
+
+Benchmarks every sort in sorting_algorithms.py, quick_sort.py and
+selection_sort.py over the distributions of sort_inputs.py.
+
+For each algorithm, distribution and size it records:
+- seconds: best wall time over ``repeat`` runs
+- comparisons: calls to <, <=, >, >= and == (counted by running the
+  sort on int / float subclasses that count their comparisons)
+- writes: element assignments into the input list (counted with a
+  list subclass; a swap is two writes). Only the in-place sorts write
+  into their input, so this is None for the others
+- peak_bytes: peak memory allocated during the sort (tracemalloc)
+- error: the exception name if the sort failed (e.g. RecursionError),
+  otherwise None
+
+Sorts are called with ``validate=False``, so the comparisons and time
+of input validation are not counted as the algorithm's own.
+
+Quadratic sorts are skipped above ``max_quadratic_size`` elements.
+
+Results are printed as a table and can be written as JSON; passing a
+previous JSON file as a baseline reports the slowdowns beyond a
+tolerance, so regressions can be tracked run over run.
+
+Usage:
+    python3 benchmark_sorts.py --sizes 1000 10000 --output results.json
+    python3 benchmark_sorts.py --baseline results.json
+"""
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import quick_sort
+import selection_sort
+import sorting_algorithms
+from sort_inputs import DISTRIBUTIONS, generate
+
+# name: (function, sorts its input in place, quadratic worst case)
+SORTS = {
+    "sorting_algorithms.merge_sort": (sorting_algorithms.merge_sort, False, False),
+    "sorting_algorithms.quick_sort": (sorting_algorithms.quick_sort, False, False),
+    "sorting_algorithms.intro_sort": (sorting_algorithms.intro_sort, True, False),
+    "sorting_algorithms.builtin_sort": (sorting_algorithms.builtin_sort, False, False),
+    "quick_sort.quick_sort": (quick_sort.quick_sort, False, True),
+    "quick_sort.quick_sort_inplace": (quick_sort.quick_sort_inplace, True, False),
+    "quick_sort.python_sort": (quick_sort.python_sort, False, False),
+    "selection_sort.selection_sort": (selection_sort.selection_sort, True, True),
+    "selection_sort.selection_sort_copy": (selection_sort.selection_sort_copy, False, True),
+    "selection_sort.selection_sort[heap]": (
+        functools.partial(selection_sort.selection_sort, mode="heap"), True, False),
+    "selection_sort.selection_sort[tournament]": (
+        functools.partial(selection_sort.selection_sort, mode="tournament"), True, False),
+}
+
+
+class _CountedComparisons:
+    """Mixin counting every rich comparison made between numbers."""
+
+    __slots__ = ()
+    comparisons = 0
+
+    def __lt__(self, other):
+        _CountedComparisons.comparisons += 1
+        return super().__lt__(other)
+
+    def __le__(self, other):
+        _CountedComparisons.comparisons += 1
+        return super().__le__(other)
+
+    def __gt__(self, other):
+        _CountedComparisons.comparisons += 1
+        return super().__gt__(other)
+
+    def __ge__(self, other):
+        _CountedComparisons.comparisons += 1
+        return super().__ge__(other)
+
+    def __eq__(self, other):
+        _CountedComparisons.comparisons += 1
+        return super().__eq__(other)
+
+
+class CountedInt(_CountedComparisons, int):
+    __hash__ = int.__hash__
+
+
+class CountedFloat(_CountedComparisons, float):
+    __hash__ = float.__hash__
+
+
+class CountingList(list):
+    """A list counting element writes made through indexing."""
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.writes += len(range(*index.indices(len(self))))
+        else:
+            self.writes += 1
+        super().__setitem__(index, value)
+
+
+def _counted(values):
+    return [CountedFloat(x) if isinstance(x, float) else CountedInt(x) for x in values]
+
+
+def measure(function, in_place, values, repeat):
+    """
+    Run one sort on one input and collect all the metrics.
+
+    Returns:
+        dict: seconds, comparisons, writes, peak_bytes and error.
+    """
+    result = {"seconds": None, "comparisons": None, "writes": None,
+              "peak_bytes": None, "error": None}
+    try:
+        timings = []
+        for _ in range(repeat):
+            data = values[:]
+            start = time.perf_counter()
+            function(data, validate=False)
+            timings.append(time.perf_counter() - start)
+        result["seconds"] = min(timings)
+
+        data = CountingList(_counted(values))
+        _CountedComparisons.comparisons = 0
+        function(data, validate=False)
+        result["comparisons"] = _CountedComparisons.comparisons
+        if in_place:
+            result["writes"] = data.writes
+
+        data = values[:]
+        tracemalloc.start()
+        try:
+            function(data, validate=False)
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    except Exception as error:
+        result["error"] = type(error).__name__
+
+    return result
+
+
+def run_benchmarks(sizes, distributions=DISTRIBUTIONS, sorts=None, repeat=3,
+                   max_quadratic_size=2000, seed=0):
+    """
+    Benchmark every selected sort over every distribution and size.
+
+    Args:
+        sizes (iterable): Input sizes.
+        distributions (iterable): Names from sort_inputs.DISTRIBUTIONS.
+        sorts (iterable | None): Names from SORTS; None runs them all.
+        repeat (int): Timed runs per case (the best one is kept).
+        max_quadratic_size (int): Largest input given to quadratic sorts.
+        seed: Seed for the random distributions.
+
+    Returns:
+        list: One dict per case (see module docstring).
+    """
+    results = []
+
+    for name in sorts or SORTS:
+        function, in_place, quadratic = SORTS[name]
+
+        for size in sizes:
+            if quadratic and size > max_quadratic_size:
+                continue
+
+            for distribution in distributions:
+                case = {"algorithm": name, "distribution": distribution, "size": size}
+                try:
+                    # The killer input is generated against each sort in turn
+                    values = generate(distribution, size, seed, sort_function=function)
+                except Exception as error:
+                    case.update(seconds=None, comparisons=None, writes=None,
+                                peak_bytes=None, error=type(error).__name__)
+                else:
+                    case.update(measure(function, in_place, values, repeat))
+                results.append(case)
+
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.2):
+    """
+    Compare wall times with a previous run.
+
+    Args:
+        results (list): Cases from run_benchmarks().
+        baseline (list): Cases from an earlier run.
+        tolerance (float): Allowed relative slowdown.
+
+    Returns:
+        list: (case, baseline seconds) for every case more than
+        ``tolerance`` slower than its baseline.
+    """
+    previous = {
+        (case["algorithm"], case["distribution"], case["size"]): case["seconds"]
+        for case in baseline
+    }
+    regressions = []
+
+    for case in results:
+        before = previous.get((case["algorithm"], case["distribution"], case["size"]))
+        if before and case["seconds"] and case["seconds"] > before * (1 + tolerance):
+            regressions.append((case, before))
+
+    return regressions
+
+
+def _print_table(results):
+    print(f"{'algorithm':<42} {'distribution':<17} {'size':>7} "
+          f"{'seconds':>9} {'comparisons':>12} {'writes':>10} {'peak KiB':>9}")
+    for case in results:
+        if case["error"]:
+            print(f"{case['algorithm']:<42} {case['distribution']:<17} "
+                  f"{case['size']:>7} {case['error']}")
+            continue
+        writes = "-" if case["writes"] is None else case["writes"]
+        print(f"{case['algorithm']:<42} {case['distribution']:<17} {case['size']:>7} "
+              f"{case['seconds']:>9.4f} {case['comparisons']:>12} {writes:>10} "
+              f"{case['peak_bytes'] / 1024:>9.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--sorts", nargs="+", choices=list(SORTS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-quadratic-size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of a previous run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.distributions, args.sorts,
+                             args.repeat, args.max_quadratic_size, args.seed)
+    _print_table(results)
+
+    if args.output:
+        report = {
+            "metadata": {
+                "python": sys.version.split()[0],
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "repeat": args.repeat,
+                "seed": args.seed,
+            },
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for case, before in regressions:
+            print(f"REGRESSION {case['algorithm']} {case['distribution']} {case['size']}: "
+                  f"{before:.4f}s -> {case['seconds']:.4f}s")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+"""
+external_sort.py
+
+External merge sort for files larger than memory.
+
+The input file is processed in two phases:
+1. Run generation: the file is streamed in chunks that fit in the
+   memory budget; each chunk is sorted in memory with merge sort
+   (sorting_algorithms.merge_sort for numbers, the same natural merge
+   engine for text lines) and spilled to a temporary run file.
+2. Merging: runs are merged with a heap, at most ``fan_in`` at a time.
+   If there are more runs than that, groups of runs are merged into
+   longer intermediate runs first, pass after pass, until one final
+   merge writes the output file.
+
+Two file formats are supported, both one item per line:
+- "numeric": ints and floats, compared numerically
+- "lines": arbitrary text lines, compared as strings
+
+Pros:
+- Sorts files of any size with bounded memory
+- Stable (equal items keep their input order)
+
+Cons:
+- Every item is written to and read from disk at least twice
+- Numbers are written back in Python's repr form
+"""
+
+import heapq
+import os
+import sys
+import tempfile
+
+from natural_merge import natural_merge_sort
+from sorting_algorithms import merge_sort
+
+MODES = ("numeric", "lines")
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_FAN_IN = 64
+
+# Each in-memory item costs one list slot for the chunk, one for the
+# sorted copy and one for merge sort's auxiliary buffer
+SLOT_OVERHEAD = 3 * 8
+
+
+def _parse_number(text):
+    """Parse one line of a numeric file as an int or a float."""
+    text = text.strip()
+    if text.lstrip("+-").isdigit():
+        return int(text)
+    return float(text)
+
+
+def _read_items(path, mode, encoding):
+    """Yield the items of an input or run file, in file order."""
+    with open(path, "r", encoding=encoding) as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if mode == "lines":
+                yield line.rstrip("\n")
+            elif line.strip():
+                try:
+                    yield _parse_number(line)
+                except ValueError:
+                    raise ValueError(
+                        f"{path}:{line_number}: not a number: {line.strip()!r}"
+                    ) from None
+
+
+def _write_items(items, path, mode, encoding):
+    """Write items one per line; returns the number written."""
+    count = 0
+    with open(path, "w", encoding=encoding) as handle:
+        for item in items:
+            handle.write(f"{item!r}\n" if mode == "numeric" else f"{item}\n")
+            count += 1
+    return count
+
+
+def _sort_chunk(chunk, mode):
+    if mode == "numeric":
+        # Every item was produced by _parse_number, so skip validation
+        return merge_sort(chunk, validate=False)
+    return natural_merge_sort(chunk)
+
+
+def _new_run_path(temp_dir):
+    handle, path = tempfile.mkstemp(prefix="run-", suffix=".txt", dir=temp_dir)
+    os.close(handle)
+    return path
+
+
+def _generate_runs(input_path, mode, memory_budget, temp_dir, encoding):
+    """Split the input into sorted run files; returns their paths in order."""
+    runs = []
+    chunk = []
+    used = 0
+
+    for item in _read_items(input_path, mode, encoding):
+        chunk.append(item)
+        used += sys.getsizeof(item) + SLOT_OVERHEAD
+
+        if used >= memory_budget:
+            path = _new_run_path(temp_dir)
+            _write_items(_sort_chunk(chunk, mode), path, mode, encoding)
+            runs.append(path)
+            chunk = []
+            used = 0
+
+    if chunk or not runs:
+        path = _new_run_path(temp_dir)
+        _write_items(_sort_chunk(chunk, mode), path, mode, encoding)
+        runs.append(path)
+
+    return runs
+
+
+def _merge_runs(paths, output_path, mode, encoding):
+    """
+    Heap-merge sorted run files into one file.
+
+    heapq.merge breaks ties by input position, and runs are always
+    listed in input order, so equal items keep their original order.
+    """
+    streams = [_read_items(path, mode, encoding) for path in paths]
+    try:
+        return _write_items(heapq.merge(*streams), output_path, mode, encoding)
+    finally:
+        for stream in streams:
+            stream.close()
+
+
+def external_sort(input_path, output_path, mode="numeric",
+                  memory_budget=DEFAULT_MEMORY_BUDGET, fan_in=DEFAULT_FAN_IN,
+                  temp_dir=None, encoding="utf-8"):
+    """
+    Sort a file that may not fit in memory.
+
+    Args:
+        input_path (str): File with one item per line.
+        output_path (str): Where to write the sorted items; may be the
+            same as input_path.
+        mode (str): "numeric" or "lines" (see module docstring). Blank
+            lines are skipped in numeric mode.
+        memory_budget (int): Approximate bytes of items held in memory
+            while generating runs.
+        fan_in (int): Maximum number of runs merged at once (and so
+            open files at once).
+        temp_dir (str | None): Directory for run files; defaults to the
+            system temporary directory.
+        encoding (str): Text encoding of the files.
+
+    Returns:
+        int: The number of items written.
+
+    Raises:
+        ValueError: If an argument is invalid or a numeric line cannot
+            be parsed.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    if not isinstance(memory_budget, int) or memory_budget <= 0:
+        raise ValueError("memory_budget must be a positive integer")
+    if not isinstance(fan_in, int) or fan_in < 2:
+        raise ValueError("fan_in must be an integer >= 2")
+
+    with tempfile.TemporaryDirectory(prefix="external-sort-", dir=temp_dir) as work_dir:
+        runs = _generate_runs(input_path, mode, memory_budget, work_dir, encoding)
+
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                path = _new_run_path(work_dir)
+                _merge_runs(group, path, mode, encoding)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+
+        return _merge_runs(runs, output_path, mode, encoding)
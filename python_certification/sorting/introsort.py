@@ -0,0 +1,182 @@
+#!/usr/bin/python3
+"""
+introsort.py
+
+An in-place introsort engine used by the sorting modules.
+
+Introsort is quicksort with two safety nets:
+- Partitions smaller than INSERTION_THRESHOLD are finished with
+  insertion sort, which is faster than recursing on tiny ranges
+- If partitioning goes deeper than 2 * log2(n) levels (a sign of
+  adversarial input), the range is finished with heapsort, keeping
+  the worst case at O(n log n)
+
+Pivots are the median of three elements, or Tukey's ninther (median
+of three medians) for large ranges, so sorted, reversed and
+organ-pipe inputs split evenly. A Hoare-style partition stops on
+elements equal to the pivot, so inputs with many duplicates also
+split evenly.
+
+Pending ranges are kept on an explicit stack and the smaller side is
+always processed first, so the stack holds at most O(log n) ranges
+and the recursion limit is never involved.
+
+Time Complexity: O(n log n) worst case
+Space Complexity: O(log n)
+"""
+
+INSERTION_THRESHOLD = 16
+NINTHER_THRESHOLD = 128
+
+
+def insertion_sort_range(arr, low, high):
+    """Sort arr[low:high] in place with insertion sort."""
+    for i in range(low + 1, high):
+        value = arr[i]
+        j = i - 1
+        while j >= low and value < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = value
+
+
+def _sift_down(arr, low, root, size):
+    """Restore the max-heap property below ``root`` in the heap arr[low:low+size]."""
+    value = arr[low + root]
+
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        if child + 1 < size and arr[low + child] < arr[low + child + 1]:
+            child += 1
+        if not value < arr[low + child]:
+            break
+        arr[low + root] = arr[low + child]
+        root = child
+
+    arr[low + root] = value
+
+
+def heap_sort_range(arr, low, high):
+    """Sort arr[low:high] in place with heapsort."""
+    size = high - low
+
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, low, root, size)
+
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        _sift_down(arr, low, 0, end)
+
+
+def _median_of_three(arr, i, j, k):
+    """Return whichever of the three indices holds the median value."""
+    a, b, c = arr[i], arr[j], arr[k]
+
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+
+def choose_pivot(arr, low, high):
+    """
+    Pick a pivot index for arr[low:high] (at least three elements).
+
+    Uses the median of first, middle and last elements, or Tukey's
+    ninther for ranges of NINTHER_THRESHOLD elements or more.
+    """
+    size = high - low
+    middle = low + size // 2
+    last = high - 1
+
+    if size < NINTHER_THRESHOLD:
+        return _median_of_three(arr, low, middle, last)
+
+    step = size // 8
+    return _median_of_three(
+        arr,
+        _median_of_three(arr, low, low + step, low + 2 * step),
+        _median_of_three(arr, middle - step, middle, middle + step),
+        _median_of_three(arr, last - 2 * step, last - step, last),
+    )
+
+
+def partition(arr, low, high):
+    """
+    Partition arr[low:high] around a chosen pivot.
+
+    Returns:
+        int: The pivot's final index p, with arr[low:p] <= arr[p]
+        and arr[p + 1:high] >= arr[p].
+    """
+    pivot_index = choose_pivot(arr, low, high)
+    arr[low], arr[pivot_index] = arr[pivot_index], arr[low]
+    pivot = arr[low]
+
+    i = low + 1
+    j = high - 1
+
+    while True:
+        while i <= j and arr[i] < pivot:
+            i += 1
+        while i <= j and pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            break
+        arr[i], arr[j] = arr[j], arr[i]
+        i += 1
+        j -= 1
+
+    arr[low], arr[j] = arr[j], arr[low]
+    return j
+
+
+def introsort(arr, low=0, high=None):
+    """
+    Sort arr[low:high] in place with introsort.
+
+    The caller is responsible for validating the input; elements only
+    need to support ``<``.
+
+    Args:
+        arr: A mutable sequence (list, array.array, ...).
+        low (int): First index of the range to sort.
+        high (int | None): End of the range (exclusive); defaults to len(arr).
+
+    Returns:
+        The same sequence object, for convenience.
+    """
+    if high is None:
+        high = len(arr)
+    if high - low < 2:
+        return arr
+
+    stack = [(low, high, 2 * (high - low).bit_length())]
+
+    while stack:
+        low, high, depth = stack.pop()
+
+        while high - low > INSERTION_THRESHOLD:
+            if depth == 0:
+                heap_sort_range(arr, low, high)
+                break
+
+            depth -= 1
+            pivot = partition(arr, low, high)
+
+            # Defer the larger side and keep working on the smaller one
+            if pivot - low > high - pivot - 1:
+                stack.append((low, pivot, depth))
+                low = pivot + 1
+            else:
+                stack.append((pivot + 1, high, depth))
+                high = pivot
+        else:
+            insertion_sort_range(arr, low, high)
+
+    return arr
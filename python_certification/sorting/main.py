@@ -1,6 +1,6 @@
 #!/usr/bin/python3
 
-from sorting_algorithms import merge_sort, quick_sort, builtin_sort
+from sorting_algorithms import merge_sort, quick_sort, intro_sort, builtin_sort
 
 data = [38, 27, 43, 3, 9, 82, 10]
 
@@ -8,3 +8,18 @@ print("Original:", data)
 print("Merge Sort:", merge_sort(data))
 print("Quick Sort:", quick_sort(data))
 print("Built-in Sort:", builtin_sort(data))
+
+in_place = data.copy()
+intro_sort(in_place)
+print("Intro Sort (in place):", in_place)
+
+# Native typed-array backends ("auto" uses NumPy when it is installed)
+print("Merge Sort (auto backend):", merge_sort(data, backend="auto"))
+# The array backend is timsort packed into a compact array.array
+print("Built-in Sort (array backend):", builtin_sort(data, backend="array", as_array=True))
+
+# Sorting records by a key; equal keys keep their original order
+people = [("Ann", 31), ("Bob", 25), ("Cid", 31), ("Dee", 25)]
+print("By age:", merge_sort(people, key=lambda person: person[1]))
+print("By age, descending:", quick_sort(people, key=lambda person: person[1], reverse=True))
+print("By name:", builtin_sort(people, key=lambda person: person[0], reverse=True))
@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+"""
+main_external_sort.py
+
+Example usage of the external merge sort on a generated file, with a
+deliberately tiny memory budget so that many runs are spilled and merged.
+"""
+
+import os
+import random
+import tempfile
+
+from external_sort import external_sort
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "numbers.txt")
+        output_path = os.path.join(directory, "sorted.txt")
+
+        with open(input_path, "w", encoding="utf-8") as handle:
+            for _ in range(100_000):
+                handle.write(f"{random.randint(-10**6, 10**6)}\n")
+
+        count = external_sort(input_path, output_path,
+                              memory_budget=256 * 1024, fan_in=8)
+
+        with open(output_path, encoding="utf-8") as handle:
+            head = [next(handle).strip() for _ in range(5)]
+
+        print(f"Sorted {count} numbers with a 256 KiB budget")
+        print("Smallest:", head)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+"""
+main_merge_streams.py
+
+Example usage of merge_streams: merging sorted lists, generators and
+files lazily.
+"""
+
+import io
+import random
+
+from merge_streams import merge_streams
+
+
+def sorted_readings(count, seed):
+    """Generator of increasing readings, as a sensor stream would produce."""
+    rng = random.Random(seed)
+    value = 0
+    for _ in range(count):
+        value += rng.randint(0, 5)
+        yield value
+
+
+def main():
+    streams = [sorted(random.randint(0, 50) for _ in range(6)) for _ in range(3)]
+    for stream in streams:
+        print("Stream:", stream)
+
+    print("\nMerged:", list(merge_streams(*streams)))
+    print("Merged, deduplicated:", list(merge_streams(*streams, dedupe=True)))
+
+    descending = [stream[::-1] for stream in streams]
+    print("Merged descending:", list(merge_streams(*descending, reverse=True)))
+
+    # Generators are consumed lazily: only the first 10 values are read
+    generators = [sorted_readings(1_000_000, seed) for seed in range(3)]
+    merged = merge_streams(*generators)
+    print("\nFirst 10 of 3 x 1,000,000 readings:", [next(merged) for _ in range(10)])
+
+    # File lines merged by their numeric value
+    first_file = io.StringIO("1.5\n8\n20\n")
+    second_file = io.StringIO("2\n9.25\n")
+    lines = merge_streams(first_file, second_file, key=float)
+    print("\nMerged file lines:", [line.strip() for line in lines])
+
+    try:
+        list(merge_streams([1, 5, 3], [2, 4]))
+    except ValueError as error:
+        print("\nUnsorted input:", error)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/python3
+"""
+main_parallel_sort.py
+
+Compares the serial merge sort with the multi-process sample sort.
+"""
+
+import os
+import random
+import time
+
+from parallel_sort import parallel_sort
+from sorting_algorithms import merge_sort
+
+
+def main():
+    numbers = [random.random() for _ in range(500_000)]
+
+    start = time.perf_counter()
+    expected = merge_sort(numbers)
+    print(f"Serial merge sort:   {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    result = parallel_sort(numbers)
+    print(f"Parallel sort ({os.cpu_count()} workers): {time.perf_counter() - start:.2f}s")
+
+    print("Same result:", result == expected)
+
+
+# Worker processes re-import this module on some platforms
+if __name__ == "__main__":
+    main()
@@ -13,3 +13,8 @@ quick_sort_inplace(numbers_copy)
 print("In-place Quick Sort:", numbers_copy)
 
 print("Python Built-in Sort:", python_sort(numbers))
+
+# Sorted input used to degrade to O(n²) and overflow the recursion limit
+already_sorted = list(range(100000))
+quick_sort_inplace(already_sorted)
+print("In-place Quick Sort on 100000 sorted numbers:", already_sorted[:3], "...", already_sorted[-3:])
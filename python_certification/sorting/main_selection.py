@@ -0,0 +1,33 @@
+#!/usr/bin/python3
+"""
+main_selection.py
+
+Example usage of the selection algorithms: top-k, median and partial sort.
+"""
+
+import random
+
+from selection import nlargest, nsmallest, nth_element, partial_sort
+
+
+def main():
+    scores = [random.randint(0, 1000) for _ in range(20)]
+    print("Scores:", scores)
+
+    print("\n3 smallest:", nsmallest(scores, 3))
+    print("3 largest:", nlargest(scores, 3))
+
+    numbers = scores.copy()
+    median = nth_element(numbers, len(numbers) // 2)
+    print("\nMedian (upper):", median)
+
+    ninetieth = nth_element(numbers, int(0.9 * (len(numbers) - 1)))
+    print("90th percentile:", ninetieth)
+
+    numbers = scores.copy()
+    partial_sort(numbers, 5)
+    print("\nAfter partial_sort(k=5):", numbers[:5], "| rest unordered")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ main.py
 Example usage of the Selection Sort implementations.
 """
 
+import random
+
 from selection_sort import selection_sort, selection_sort_copy
 
 
@@ -29,6 +31,13 @@ def main():
     print("Sorted copy:")
     print(sorted_copy)
 
+    print("\nComparing selection modes on 2000 random numbers:")
+    values = [random.random() for _ in range(2000)]
+    for mode in ("scan", "heap", "tournament"):
+        stats = {}
+        selection_sort_copy(values, mode=mode, stats=stats)
+        print(f"{mode:>10}: {stats}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,109 @@
+#!/usr/bin/python3
+"""
+merge_streams.py
+
+Lazy k-way merge of already-sorted inputs.
+
+merge_streams() takes any number of sorted iterables (lists,
+generators, open files, ...) and yields their elements in sorted
+order. It keeps one pending element per input in a min-heap, so
+memory stays O(k) for k inputs however long they are, and each
+element costs O(log k) comparisons.
+
+Instead of concatenating the inputs and sorting again in O(n log n)
+with everything held in memory, the output can be consumed as it is
+produced.
+
+Options:
+- key: merge by a key computed once per element (e.g. key=float for
+  the lines of numeric text files)
+- reverse: the inputs are sorted in descending order
+- dedupe: yield only the first of each run of equal keys
+- validate: check that every input really is sorted, raising
+  ValueError otherwise (a merge of unsorted inputs is silently wrong)
+
+Pros:
+- O(k) memory, works on generators and files of any length
+- Stable: equal elements are yielded in input order (first iterable
+  first)
+
+Cons:
+- Each input must already be sorted by the same key and direction
+- Pure Python: slower per element than heapq.merge when no key,
+  dedupe or order checking is needed
+"""
+
+from heapq import heapify, heappop, heapreplace
+
+
+class _Descending:
+    """Wraps a key so that the min-heap yields the largest key first."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def merge_streams(*iterables, key=None, reverse=False, dedupe=False, validate=True):
+    """
+    Merge sorted iterables into one sorted stream, lazily.
+
+    Args:
+        *iterables: The sorted inputs.
+        key (callable | None): Computes the sort key of an element,
+            called once per element.
+        reverse (bool): The inputs (and output) are in descending order.
+        dedupe (bool): Skip elements whose key equals the key of the
+            element yielded just before.
+        validate (bool): Raise ValueError if an input is out of order.
+
+    Yields:
+        The elements of all inputs, in sorted order.
+
+    Raises:
+        TypeError: If an argument is not iterable.
+        ValueError: If validate is True and an input is not sorted.
+    """
+    def order_of(item):
+        value = item if key is None else key(item)
+        return _Descending(value) if reverse else value
+
+    # [order, input index, element, iterator]; the index breaks ties, so
+    # elements and iterators are never compared
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.append([order_of(item), index, item, iterator])
+            break
+    heapify(heap)
+
+    has_last = False
+    last = None
+
+    while heap:
+        entry = heap[0]
+        order, index, item, iterator = entry
+
+        if not (dedupe and has_last and order == last):
+            yield item
+            has_last = True
+            last = order
+
+        for following in iterator:
+            following_order = order_of(following)
+            if validate and following_order < order:
+                raise ValueError(f"input {index} is not sorted")
+            entry[0] = following_order
+            entry[2] = following
+            heapreplace(heap, entry)
+            break
+        else:
+            heappop(heap)
@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+"""
+natural_merge.py
+
+An iterative, bottom-up natural merge sort used by the sorting modules.
+
+Instead of splitting the input in halves recursively, the sort:
+1. Scans the input once for existing runs: non-decreasing runs are
+   kept as they are, strictly decreasing runs are reversed in place
+   (which keeps the sort stable). Runs shorter than MIN_RUN are
+   extended with binary insertion sort.
+2. Merges neighbouring runs pairwise, pass after pass, ping-ponging
+   between the input and a single auxiliary buffer of the same size.
+
+During a merge, once one side has won MIN_GALLOP times in a row the
+merge "gallops": it binary-searches how many more elements come from
+that side and copies them as one slice. Already-ordered neighbours are
+detected with one comparison and copied straight across.
+
+Pros:
+- Stable
+- O(n log n) worst case, O(n) on already sorted or reversed input
+- Exactly one auxiliary buffer, no recursion
+
+Cons:
+- Needs n extra slots of memory
+"""
+
+from bisect import bisect_left, bisect_right
+
+MIN_RUN = 32
+MIN_GALLOP = 7
+COPY_CHUNK = 4096
+
+
+def _binary_insertion_sort(arr, low, start, high):
+    """Extend the sorted range arr[low:start] to cover arr[low:high]."""
+    for i in range(start, high):
+        value = arr[i]
+        position = bisect_right(arr, value, low, i)
+        arr[position + 1:i + 1] = arr[position:i]
+        arr[position] = value
+
+
+def _copy(src, dst, start, stop, to):
+    """
+    Copy src[start:stop] to dst[to:...] in bounded chunks.
+
+    Slice assignment builds a temporary slice first, so chunking keeps
+    the transient memory at COPY_CHUNK slots instead of up to n.
+    """
+    while start < stop:
+        end = min(start + COPY_CHUNK, stop)
+        dst[to:to + end - start] = src[start:end]
+        to += end - start
+        start = end
+
+
+def _count_run(arr, low, high):
+    """
+    Find the run starting at ``low``, reversing it if it is descending.
+
+    Returns:
+        int: The end (exclusive) of the run.
+    """
+    end = low + 1
+    if end == high:
+        return end
+
+    if arr[end] < arr[low]:
+        # Strictly descending, so reversing it cannot reorder equal elements
+        while end < high and arr[end] < arr[end - 1]:
+            end += 1
+        i, j = low, end - 1
+        while i < j:
+            arr[i], arr[j] = arr[j], arr[i]
+            i += 1
+            j -= 1
+    else:
+        while end < high and not arr[end] < arr[end - 1]:
+            end += 1
+
+    return end
+
+
+def _merge(src, dst, low, mid, high):
+    """Merge the sorted runs src[low:mid] and src[mid:high] into dst[low:high]."""
+    if not src[mid] < src[mid - 1]:
+        _copy(src, dst, low, high, low)
+        return
+
+    i, j, k = low, mid, low
+    left_wins = right_wins = 0
+
+    while i < mid and j < high:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+
+            if right_wins >= MIN_GALLOP:
+                # Everything on the right strictly below src[i] goes next
+                end = bisect_left(src, src[i], j, high)
+                _copy(src, dst, j, end, k)
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+
+            if left_wins >= MIN_GALLOP and j < high:
+                # Everything on the left up to and including src[j] goes next
+                end = bisect_right(src, src[j], i, mid)
+                _copy(src, dst, i, end, k)
+                k += end - i
+                i = end
+                left_wins = 0
+
+    if i < mid:
+        _copy(src, dst, i, mid, k)
+    else:
+        _copy(src, dst, j, high, k)
+
+
+def natural_merge_sort(arr):
+    """
+    Sort a mutable sequence in place with a stable bottom-up merge sort.
+
+    The caller is responsible for validating the input; elements only
+    need to support ``<``.
+
+    Args:
+        arr: A list (or array.array) to sort.
+
+    Returns:
+        The same sequence object, for convenience.
+    """
+    size = len(arr)
+    if size < 2:
+        return arr
+
+    runs = [0]
+    low = 0
+    while low < size:
+        end = _count_run(arr, low, size)
+        if end - low < MIN_RUN:
+            forced = min(low + MIN_RUN, size)
+            _binary_insertion_sort(arr, low, end, forced)
+            end = forced
+        runs.append(end)
+        low = end
+
+    if len(runs) == 2:
+        return arr
+
+    # Copying keeps the buffer the same type as the input (list or array)
+    src, dst = arr, arr[:]
+
+    while len(runs) > 2:
+        merged = [0]
+
+        for r in range(0, len(runs) - 2, 2):
+            _merge(src, dst, runs[r], runs[r + 1], runs[r + 2])
+            merged.append(runs[r + 2])
+
+        if len(runs) % 2 == 0:
+            # Odd number of runs: the last one has no partner this pass
+            low = runs[-2]
+            _copy(src, dst, low, size, low)
+            merged.append(size)
+
+        runs = merged
+        src, dst = dst, src
+
+    if src is not arr:
+        _copy(src, arr, 0, size, 0)
+
+    return arr
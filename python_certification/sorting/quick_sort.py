@@ -4,26 +4,35 @@ sorting_algorithms.py
 
 This module provides multiple sorting algorithms:
 1. Functional Quicksort (easy to read)
-2. In-place Quicksort (memory efficient)
+2. In-place Quicksort (memory efficient, introsort engine)
 3. Python built-in sort (Timsort)
 
 Each approach includes pros and cons.
 """
 
+from introsort import choose_pivot, introsort
+from sort_keys import sort_in_place_with_key, sort_with_key
+from validation import validate_numbers
+
+
 def validate_array(array):
-    if not isinstance(array, list):
-        raise TypeError("Input must be a list")
-    if not all(isinstance(x, (int, float)) for x in array):
-        raise ValueError("All elements must be numbers")
+    """Validate a list of numbers (or numeric typed array), see validation.py."""
+    validate_numbers(array)
 
 
 # ----------------------------
 # 1. Functional Quicksort
 # ----------------------------
-def quick_sort(array):
+def quick_sort(array, key=None, reverse=False, validate=True):
     """
     Sorts a list using functional quicksort (returns a new list).
 
+    The pivot is the median of three elements (Tukey's ninther for
+    large lists), so sorted, reversed and organ-pipe inputs split
+    evenly. Only the smaller side is sorted recursively while the
+    larger one is handled by a loop, so recursion depth stays
+    O(log n) on any input.
+
     Pros:
     - Easy to read and understand
     - Handles duplicates
@@ -32,29 +41,67 @@ def quick_sort(array):
     Cons:
     - Uses extra memory
     - Slower for large lists
+    - Not stable (stable when key or reverse is given, see sort_keys.py)
+
+    Args:
+        array (list): The numbers to sort, or any elements when
+            key is given.
+        key (callable | None): Computes a comparable sort key (e.g. a
+            number, string or tuple) per element.
+        reverse (bool): Sort in descending order.
+        validate (bool): Set to False to skip input validation for
+            trusted input.
     """
+    return sort_with_key(array, _quick_sort_into, key, reverse,
+                         validate_array if validate else None)
+
 
-    validate_array(array)
+def _quick_sort(array):
+    # Sorted pieces found so far, to the left and to the right of array
+    before = []
+    after = []
 
-    if len(array) <= 1:
-        return array
+    while len(array) > 1:
+        if len(array) > 2:
+            pivot = array[choose_pivot(array, 0, len(array))]
+        else:
+            pivot = array[-1]
 
-    pivot = array[-1]
+        left_side = [x for x in array if x < pivot]
+        equal     = [x for x in array if x == pivot]
+        right_side= [x for x in array if x > pivot]
 
-    left_side = [x for x in array if x < pivot]
-    equal     = [x for x in array if x == pivot]
-    right_side= [x for x in array if x > pivot]
+        if len(left_side) <= len(right_side):
+            before += _quick_sort(left_side) + equal
+            array = right_side
+        else:
+            after.append(equal + _quick_sort(right_side))
+            array = left_side
 
-    return quick_sort(left_side) + equal + quick_sort(right_side)
+    for piece in reversed(after):
+        array += piece
+
+    return before + array
+
+
+def _quick_sort_into(array):
+    array[:] = _quick_sort(array)
+    return array
 
 
 # ----------------------------
 # 2. In-place Quicksort
 # ----------------------------
-def quick_sort_inplace(array):
+def quick_sort_inplace(array, key=None, reverse=False, validate=True):
     """
     Sorts a list in place using quicksort.
 
+    Runs the introsort engine: median-of-three (ninther for large
+    ranges) pivots, insertion sort for small partitions, a heapsort
+    fallback at the depth limit and an explicit stack, so sorted or
+    adversarial input stays O(n log n) and never hits the recursion
+    limit. The partition step is introsort.partition.
+
     Pros:
     - Fast
     - Memory efficient
@@ -62,36 +109,26 @@ def quick_sort_inplace(array):
     Cons:
     - Harder to understand
     - Mutates original list
+    - Not stable (stable when key or reverse is given, see sort_keys.py)
+
+    Args:
+        array (list): The numbers to sort in place, or any elements when key
+            is given.
+        key (callable | None): Computes a comparable sort key (e.g. a
+            number, string or tuple) per element.
+        reverse (bool): Sort in descending order.
+        validate (bool): Set to False to skip input validation for
+            trusted input.
     """
 
-    validate_array(array)
-
-    def partition(arr, low, high):
-        pivot = arr[high]
-        i = low - 1
-
-        for j in range(low, high):
-            if arr[j] <= pivot:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1
-
-    def _quick_sort(arr, low, high):
-        if low < high:
-            pi = partition(arr, low, high)
-            _quick_sort(arr, low, pi - 1)
-            _quick_sort(arr, pi + 1, high)
-
-    _quick_sort(array, 0, len(array) - 1)
-    return array
+    return sort_in_place_with_key(array, introsort, key, reverse,
+                                  validate_array if validate else None)
 
 
 # ----------------------------
 # 3. Built-in Sort (Alternative)
 # ----------------------------
-def python_sort(array):
+def python_sort(array, key=None, reverse=False, validate=True):
     """
     Sorts a list using Python's built-in Timsort.
 
@@ -102,7 +139,16 @@ def python_sort(array):
 
     Cons:
     - Abstracts away algorithm details
+
+    Args:
+        array (list): The numbers to sort, or any elements when
+            key is given.
+        key (callable | None): Computes a comparable sort key (e.g. a
+            number, string or tuple) per element.
+        reverse (bool): Sort in descending order.
+        validate (bool): Set to False to skip input validation for
+            trusted input.
     """
 
-    validate_array(array)
-    return sorted(array)
+    return sort_with_key(array, list.sort, key, reverse,
+                         validate_array if validate else None)
@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+"""
+selection.py
+
+Selection algorithms: finding the k smallest / largest elements, or
+the element at a given sorted position, without sorting everything.
+
+Algorithms Included:
+- nsmallest / nlargest: the k extreme elements of any iterable, in
+  order, using a bounded heap (heapq) in O(n log k) time and O(k) memory
+- nth_element: introselect, in place; repeatedly partitions (with
+  introsort.partition, the routine behind quick_sort.quick_sort_inplace)
+  and keeps only the side holding position n, falling back to heapsort
+  on the remaining range if partitioning goes too deep. O(n) on average
+- partial_sort: in place; selects the k smallest with nth_element,
+  then sorts only those k. O(n + k log k) on average
+
+Use these for top-k, median and percentile queries instead of a full
+O(n log n) sort.
+"""
+
+import heapq
+
+from introsort import (
+    INSERTION_THRESHOLD, heap_sort_range, insertion_sort_range, introsort, partition,
+)
+from sort_keys import sort_in_place_with_key
+from validation import validate_comparable
+
+
+def _validate_count(k):
+    if not isinstance(k, int):
+        raise TypeError("k must be an integer")
+    if k < 0:
+        raise ValueError("k must be >= 0")
+
+
+def _select(arr, nth, low, high):
+    """Rearrange arr[low:high] so that arr[nth] holds its sorted value."""
+    depth = 2 * (high - low).bit_length()
+
+    while high - low > INSERTION_THRESHOLD:
+        if depth == 0:
+            heap_sort_range(arr, low, high)
+            return
+
+        depth -= 1
+        pivot = partition(arr, low, high)
+
+        if pivot == nth:
+            return
+        if nth < pivot:
+            high = pivot
+        else:
+            low = pivot + 1
+
+    insertion_sort_range(arr, low, high)
+
+
+def nsmallest(iterable, k, key=None, validate=True):
+    """
+    Return the k smallest elements, in ascending order.
+
+    Equivalent to ``sorted(iterable, key=key)[:k]`` (including the
+    order of equal elements) but keeps only k elements in a heap.
+
+    Args:
+        iterable: Any iterable, e.g. a list, generator or file.
+        k (int): Number of elements wanted.
+        key (callable | None): Computes a comparable key per element.
+        validate (bool): Check that list elements are comparable (other
+            iterables are consumed lazily and are not checked).
+
+    Returns:
+        list: Up to k elements.
+
+    Raises:
+        TypeError: If k is not an integer.
+        ValueError: If k is negative or list elements are not comparable.
+    """
+    _validate_count(k)
+    if validate and key is None and isinstance(iterable, list):
+        validate_comparable(iterable)
+    return heapq.nsmallest(k, iterable, key=key)
+
+
+def nlargest(iterable, k, key=None, validate=True):
+    """
+    Return the k largest elements, in descending order.
+
+    Equivalent to ``sorted(iterable, key=key, reverse=True)[:k]``; see
+    nsmallest for the arguments.
+    """
+    _validate_count(k)
+    if validate and key is None and isinstance(iterable, list):
+        validate_comparable(iterable)
+    return heapq.nlargest(k, iterable, key=key)
+
+
+def nth_element(arr, n, key=None, reverse=False, validate=True):
+    """
+    Partially order a list in place around its n-th sorted position.
+
+    Afterwards arr[n] is the element a full sort would put there, every
+    element before it is <= arr[n] and every element after it is >=
+    arr[n] (reversed comparisons when reverse is True). The order
+    within each side is unspecified.
+
+    Args:
+        arr (list): The elements; a numeric typed array also works.
+        n (int): Sorted position; negative values count from the end.
+        key (callable | None): Computes a comparable key per element,
+            once per element.
+        reverse (bool): Select by descending order (n=0 is the maximum).
+        validate (bool): Set to False to skip input validation.
+
+    Returns:
+        The element at position n, e.g. the median for n = len(arr) // 2.
+
+    Raises:
+        TypeError: If arr is not a list or n is not an integer.
+        ValueError: If elements are not comparable.
+        IndexError: If n is out of range.
+    """
+    if not isinstance(n, int):
+        raise TypeError("n must be an integer")
+    if n < 0:
+        n += len(arr)
+    if not 0 <= n < len(arr):
+        raise IndexError("nth_element index out of range")
+
+    # Reverse order is handled by sort_keys as an ascending order that is
+    # read backwards, so the position is mirrored
+    target = len(arr) - 1 - n if reverse else n
+
+    def select(items):
+        _select(items, target, 0, len(items))
+
+    sort_in_place_with_key(arr, select, key, reverse,
+                           validate_comparable if validate else None)
+    return arr[n]
+
+
+def partial_sort(arr, k, key=None, reverse=False, validate=True):
+    """
+    Sort only the k smallest elements of a list, in place.
+
+    Afterwards arr[:k] holds the k smallest elements in ascending
+    order (descending order of the k largest if reverse is True); the
+    order of arr[k:] is unspecified.
+
+    Args:
+        arr (list): The elements; a numeric typed array also works.
+        k (int): Number of leading elements to sort; values above
+            len(arr) sort everything.
+        key (callable | None): Computes a comparable key per element,
+            once per element.
+        reverse (bool): Sort the k largest in descending order.
+        validate (bool): Set to False to skip input validation.
+
+    Returns:
+        The same list object.
+
+    Raises:
+        TypeError: If arr is not a list or k is not an integer.
+        ValueError: If k is negative or elements are not comparable.
+    """
+    _validate_count(k)
+
+    def select_and_sort(items):
+        size = len(items)
+        count = min(k, size)
+
+        if reverse:
+            # The k largest go to the back; sort_keys reads them backwards
+            start = size - count
+            if 0 < start < size:
+                _select(items, start, 0, size)
+            introsort(items, start, size)
+        else:
+            if 0 < count < size:
+                _select(items, count - 1, 0, size)
+            introsort(items, 0, count)
+
+    return sort_in_place_with_key(arr, select_and_sort, key, reverse,
+                                  validate_comparable if validate else None)
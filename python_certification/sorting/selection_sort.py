@@ -8,18 +8,38 @@ Algorithms Included:
 - selection_sort (in-place)
 - selection_sort_copy (returns a new sorted list)
 
+Both select the next element with one of three modes:
+- "scan" (default): classic selection sort, rescanning the unsorted
+  tail for its minimum. O(n^2) comparisons
+- "heap": heapsort, i.e. selection sort whose unsorted part is kept as
+  a max-heap, so the next element is selected in O(log n). In place,
+  O(n log n)
+- "tournament": a winner tree over the elements; after each selection
+  only the winner's path to the root is replayed, O(log n)
+  comparisons. O(n log n), O(n) extra memory, stable
+
+Passing a dict as ``stats`` fills it with the number of comparisons,
+swaps (two elements exchanged) and moves (one element written) made
+by the sort, so the modes can be compared.
+
 Pros:
 - Simple and easy to understand
-- In-place sorting (low memory usage)
+- In-place sorting (low memory usage), except in tournament mode
 
 Cons:
-- O(n^2) time complexity (slow for large lists)
-- Not stable (relative order of equal elements may change)
+- O(n^2) time complexity in scan mode (slow for large lists)
+- Not stable (relative order of equal elements may change) in scan
+  and heap modes, except when key or reverse is given (see sort_keys.py)
 """
 
+from sort_keys import sort_in_place_with_key, sort_with_key
+from validation import validate_comparable
+
+
 def _validate_input(arr):
     """
-    Validates that the input is a list of comparable elements.
+    Validates that the input is a list of comparable elements
+    (see validation.validate_comparable).
 
     Args:
         arr (list): Input list.
@@ -28,18 +48,11 @@ def _validate_input(arr):
         TypeError: If input is not a list.
         ValueError: If list contains non-comparable elements.
     """
-    if not isinstance(arr, list):
-        raise TypeError("Input must be a list")
-
-    # Check if elements are comparable by attempting a comparison
-    for i in range(len(arr) - 1):
-        try:
-            _ = arr[i] < arr[i + 1]
-        except Exception:
-            raise ValueError("All elements in the list must be comparable")
+    validate_comparable(arr)
 
 
-def selection_sort(arr):
+def selection_sort(arr, key=None, reverse=False, validate=True, mode="scan",
+                   stats=None):
     """
     Sorts a list of comparable elements in ascending order using Selection Sort.
     This function sorts the list in-place.
@@ -51,17 +64,48 @@ def selection_sort(arr):
     4. Swap the smallest found element with index i.
     5. Move to the next index and repeat until sorted.
 
+    The "heap" and "tournament" modes replace step 3 with an O(log n)
+    selection (see module docstring).
+
     Args:
         arr (list): List of comparable elements.
+        key (callable | None): Computes a comparable sort key per
+            element, called once per element.
+        reverse (bool): Sort in descending order.
+        validate (bool): Set to False to skip input validation for
+            trusted input.
+        mode (str): "scan", "heap" or "tournament".
+        stats (dict | None): If given, filled with "comparisons",
+            "swaps" and "moves" counts.
 
     Returns:
         list: The same list object, sorted in ascending order.
+
+    Raises:
+        ValueError: If mode is unknown.
     """
-    _validate_input(arr)
+    return sort_in_place_with_key(arr, _core(mode, stats), key, reverse,
+                                  _validate_input if validate else None)
 
+
+def _core(mode, stats):
+    """Return the in-place sort for a mode, reporting into stats."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {tuple(MODES)}")
+
+    sort = MODES[mode]
+
+    def run(arr):
+        comparisons, swaps, moves = sort(arr)
+        if stats is not None:
+            stats.update(comparisons=comparisons, swaps=swaps, moves=moves)
+
+    return run
+
+
+def _selection_sort(arr):
     n = len(arr)
-    if n < 2:
-        return arr
+    swaps = 0
 
     for i in range(n):
         min_index = i
@@ -72,20 +116,118 @@ def selection_sort(arr):
 
         if min_index != i:
             arr[i], arr[min_index] = arr[min_index], arr[i]
+            swaps += 1
 
-    return arr
+    # Every pair (i, j) with i < j is compared exactly once
+    return n * (n - 1) // 2, swaps, 0
 
 
-def selection_sort_copy(arr):
+def _sift_down(arr, root, end):
+    """Restore the max-heap arr[:end] below root; returns (comparisons, swaps)."""
+    comparisons = swaps = 0
+
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            break
+        if child + 1 < end:
+            comparisons += 1
+            if arr[child] < arr[child + 1]:
+                child += 1
+        comparisons += 1
+        if not arr[root] < arr[child]:
+            break
+        arr[root], arr[child] = arr[child], arr[root]
+        swaps += 1
+        root = child
+
+    return comparisons, swaps
+
+
+def _heap_selection_sort(arr):
+    n = len(arr)
+    comparisons = swaps = 0
+
+    for root in range(n // 2 - 1, -1, -1):
+        compared, swapped = _sift_down(arr, root, n)
+        comparisons += compared
+        swaps += swapped
+
+    # Select the maximum of the unsorted part and move it to the back
+    for end in range(n - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        compared, swapped = _sift_down(arr, 0, end)
+        comparisons += compared
+        swaps += swapped + 1
+
+    return comparisons, swaps, 0
+
+
+def _tournament_selection_sort(arr):
+    n = len(arr)
+    if n < 2:
+        return 0, 0, 0
+
+    values = list(arr)
+    leaves = 1 << (n - 1).bit_length()
+    # Each node holds the index of the winner (minimum) below it, -1 if none
+    tree = [-1] * (2 * leaves)
+    tree[leaves:leaves + n] = range(n)
+    comparisons = 0
+
+    def play(node):
+        left, right = tree[2 * node], tree[2 * node + 1]
+        if left == -1 or right == -1:
+            tree[node] = left if right == -1 else right
+            return 0
+        # Ties go to the left (earlier) element, keeping the sort stable
+        tree[node] = right if values[right] < values[left] else left
+        return 1
+
+    for node in range(leaves - 1, 0, -1):
+        comparisons += play(node)
+
+    for position in range(n):
+        winner = tree[1]
+        arr[position] = values[winner]
+
+        node = leaves + winner
+        tree[node] = -1
+        node //= 2
+        while node:
+            comparisons += play(node)
+            node //= 2
+
+    return comparisons, 0, n
+
+
+MODES = {
+    "scan": _selection_sort,
+    "heap": _heap_selection_sort,
+    "tournament": _tournament_selection_sort,
+}
+
+
+def selection_sort_copy(arr, key=None, reverse=False, validate=True, mode="scan",
+                        stats=None):
     """
     Returns a new sorted list using Selection Sort without mutating the original list.
 
     Args:
         arr (list): List of comparable elements.
+        key (callable | None): Computes a comparable sort key per element.
+        reverse (bool): Sort in descending order.
+        validate (bool): Set to False to skip input validation for
+            trusted input.
+        mode (str): "scan", "heap" or "tournament".
+        stats (dict | None): If given, filled with "comparisons",
+            "swaps" and "moves" counts.
 
     Returns:
         list: A new sorted list.
+
+    Raises:
+        ValueError: If mode is unknown.
     """
-    _validate_input(arr)
-    copied = arr[:]
-    return selection_sort(copied)
+    return sort_with_key(arr, _core(mode, stats), key, reverse,
+                         _validate_input if validate else None)
@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+"""
+sort_inputs.py
+
+Input generators for benchmarking the sorting algorithms.
+
+Distributions:
+- random: uniformly random floats
+- sorted / reversed: 0..n-1 ascending / descending
+- few_unique: random ints drawn from only 8 distinct values
+- organ_pipe: ascending to the middle, then descending
+- sawtooth: ascending runs of about sqrt(n) elements, repeated
+- quicksort_killer: McIlroy's adversary ("A Killer Adversary for
+  Quicksort"), built by running a target sort on placeholder values
+  and fixing each value only when the sort first depends on it, so
+  the pivots keep turning out to be the smallest candidates
+
+The killer input depends on the algorithm it is generated against;
+by default that is sorting_algorithms.quick_sort.
+"""
+
+import math
+import random
+
+DISTRIBUTIONS = (
+    "random", "sorted", "reversed", "few_unique",
+    "organ_pipe", "sawtooth", "quicksort_killer",
+)
+
+FEW_UNIQUE_VALUES = 8
+
+
+class _Adversary:
+    """Shared state of McIlroy's adversary for one generated input."""
+
+    def __init__(self, size):
+        self.gas = size
+        self.values = [size] * size
+        self.solid = 0
+        self.candidate = 0
+
+    def freeze(self, index):
+        self.values[index] = self.solid
+        self.solid += 1
+
+    def compare(self, x, y):
+        values, gas = self.values, self.gas
+        if values[x] == gas and values[y] == gas:
+            self.freeze(x if x == self.candidate else y)
+        if values[x] == gas:
+            self.candidate = x
+        elif values[y] == gas:
+            self.candidate = y
+        return values[x] - values[y]
+
+
+class _Placeholder(int):
+    """
+    An int (so it passes input validation) whose comparisons are
+    answered by the adversary. Its int value is its position.
+    """
+
+    adversary = None
+
+    def __lt__(self, other):
+        return self.adversary.compare(int(self), int(other)) < 0
+
+    def __le__(self, other):
+        return self.adversary.compare(int(self), int(other)) <= 0
+
+    def __gt__(self, other):
+        return self.adversary.compare(int(self), int(other)) > 0
+
+    def __ge__(self, other):
+        return self.adversary.compare(int(self), int(other)) >= 0
+
+    def __eq__(self, other):
+        return self.adversary.compare(int(self), int(other)) == 0
+
+    __hash__ = int.__hash__
+
+
+def quicksort_killer(size, sort_function=None):
+    """
+    Build an input that drives a comparison sort to its worst case.
+
+    Args:
+        size (int): Number of elements.
+        sort_function (callable | None): The sort to attack, called with
+            a list and validate=False (so validation comparisons do not
+            feed the adversary); defaults to sorting_algorithms.quick_sort.
+
+    Returns:
+        list: A permutation of range(size).
+    """
+    if sort_function is None:
+        from sorting_algorithms import quick_sort as sort_function
+
+    adversary = _Adversary(size)
+    placeholder = type("_BoundPlaceholder", (_Placeholder,), {"adversary": adversary})
+    sort_function([placeholder(i) for i in range(size)], validate=False)
+
+    # Values the sort never depended on are frozen in position order
+    for index in range(size):
+        if adversary.values[index] == adversary.gas:
+            adversary.freeze(index)
+
+    return adversary.values
+
+
+def generate(distribution, size, seed=None, sort_function=None):
+    """
+    Generate a benchmark input.
+
+    Args:
+        distribution (str): One of DISTRIBUTIONS.
+        size (int): Number of elements.
+        seed: Seed for the random distributions, for reproducible inputs.
+        sort_function (callable | None): Target of "quicksort_killer".
+
+    Returns:
+        list: The generated numbers.
+
+    Raises:
+        ValueError: If the distribution is unknown or size is negative.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"distribution must be one of {DISTRIBUTIONS}")
+    if not isinstance(size, int) or size < 0:
+        raise ValueError("size must be a non-negative integer")
+
+    rng = random.Random(seed)
+
+    if distribution == "random":
+        return [rng.random() for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(size))
+    if distribution == "reversed":
+        return list(range(size - 1, -1, -1))
+    if distribution == "few_unique":
+        return [rng.randrange(FEW_UNIQUE_VALUES) for _ in range(size)]
+    if distribution == "organ_pipe":
+        half = size // 2
+        return list(range(half)) + list(range(size - half - 1, -1, -1))
+    if distribution == "sawtooth":
+        tooth = max(1, math.isqrt(size))
+        return [i % tooth for i in range(size)]
+    return quicksort_killer(size, sort_function)
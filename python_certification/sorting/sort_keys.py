@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+"""
+sort_keys.py
+
+Key function and reverse-order support shared by the sorting modules.
+
+Every sort accepts ``key=`` and ``reverse=`` through the
+decorate-sort-undecorate pattern:
+1. Compute each element's key exactly once.
+2. Sort triples (key, tiebreak, element) with the module's own
+   algorithm. The tiebreak is the element's position (negated for
+   reverse order), so triples are never equal and the elements
+   themselves are never compared.
+3. Strip the decoration (reading backwards for reverse order).
+
+Because ties are broken by the original position, every sort is
+stable whenever ``key`` or ``reverse`` is given, including quicksort
+and selection sort. Without them, the stable sorts are merge_sort,
+builtin_sort and python_sort; quick_sort, intro_sort,
+quick_sort_inplace and selection_sort (except in tournament mode)
+are not stable (for plain numbers this cannot be observed).
+"""
+
+from array import array
+
+from validation import is_typed_numeric, validate_comparable
+
+
+def compute_keys(arr, key, validate=None):
+    """
+    Compute and validate the sort keys of a sequence.
+
+    The module's validator (numbers only for the numeric sorts) checks
+    the elements themselves. Keys computed by a key function only need
+    to be mutually comparable, so records can be sorted by string or
+    tuple keys; they are checked with validate_comparable instead.
+
+    Args:
+        arr: The elements to sort.
+        key (callable | None): Key function; None sorts the elements themselves.
+        validate (callable | None): The module's validator, run on the
+            elements when key is None; None skips validation.
+
+    Returns:
+        The keys (``arr`` itself when key is None).
+
+    Raises:
+        TypeError: If validation is enabled and arr is neither a list
+            nor a numeric typed array.
+    """
+    if key is not None:
+        if validate is not None and not (isinstance(arr, list) or is_typed_numeric(arr)):
+            raise TypeError("Input must be a list")
+        keys = list(map(key, arr))
+    else:
+        keys = arr
+
+    if validate is not None:
+        if key is not None:
+            validate_comparable(keys)
+        else:
+            validate(keys)
+    return keys
+
+
+def decorate(arr, keys, reverse=False):
+    """
+    Pair each element with its key and a position tiebreak.
+
+    Returns:
+        list: (key, tiebreak, element) triples, in input order.
+    """
+    if reverse:
+        positions = range(0, -len(arr), -1)
+    else:
+        positions = range(len(arr))
+    return list(zip(keys, positions, arr))
+
+
+def undecorate(decorated, reverse=False):
+    """
+    Strip the decoration from a sorted list of triples.
+
+    Returns:
+        list: The elements, in descending key order if reverse is True.
+    """
+    if reverse:
+        decorated = reversed(decorated)
+    return [element for _, _, element in decorated]
+
+
+def sort_with_key(arr, sort_in_place, key=None, reverse=False, validate=None):
+    """
+    Sort a copy of a sequence with an in-place sort, honouring key and reverse.
+
+    Args:
+        arr: The elements to sort (not modified).
+        sort_in_place (callable): Unvalidated in-place sort of a list.
+        key (callable | None): Key function, called once per element.
+        reverse (bool): Sort in descending order (still stable).
+        validate (callable | None): Validator run on the elements (keys
+            from a key function only need to be comparable); None skips
+            validation.
+
+    Returns:
+        list: A new sorted list.
+
+    Raises:
+        TypeError: If validation is enabled and arr is neither a list
+            nor a numeric typed array.
+    """
+    keys = compute_keys(arr, key, validate)
+
+    if key is None and not reverse:
+        copied = list(arr)
+        sort_in_place(copied)
+        return copied
+
+    decorated = decorate(arr, keys, reverse)
+    sort_in_place(decorated)
+    return undecorate(decorated, reverse)
+
+
+def sort_in_place_with_key(arr, sort_in_place, key=None, reverse=False,
+                           validate=None):
+    """
+    Sort a list or typed array in place, honouring key and reverse.
+
+    Without key and reverse the sort runs directly on ``arr``;
+    otherwise the sorted elements are written back into it.
+
+    Args:
+        arr: The mutable sequence to sort.
+        sort_in_place (callable): Unvalidated in-place sort.
+        key (callable | None): Key function, called once per element.
+        reverse (bool): Sort in descending order (still stable).
+        validate (callable | None): Validator run on the elements (keys
+            from a key function only need to be comparable); None skips
+            validation.
+
+    Returns:
+        The same sequence object, sorted.
+    """
+    if key is None and not reverse:
+        if validate is not None:
+            validate(arr)
+        sort_in_place(arr)
+        return arr
+
+    result = sort_with_key(arr, sort_in_place, key, reverse, validate)
+
+    if isinstance(arr, list):
+        arr[:] = result
+    else:
+        # Typed arrays only accept slices of the same item type
+        typecode = arr.typecode if isinstance(arr, array) else arr.format
+        arr[:] = array(typecode.lstrip("@"), result)
+
+    return arr
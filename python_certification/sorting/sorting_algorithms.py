@@ -7,76 +7,153 @@ A collection of sorting algorithms with validation and documentation.
 
 from typing import List, Any
 
+from introsort import introsort
+from natural_merge import natural_merge_sort
+from sort_keys import compute_keys, sort_in_place_with_key, sort_with_key
+from validation import validate_numbers
+from vectorized_sort import argsort, vectorized_sort
 
-def validate_input(arr):
-    if not isinstance(arr, list):
-        raise TypeError("Input must be a list")
-    if not all(isinstance(x, (int, float)) for x in arr):
-        raise ValueError("All elements must be numbers")
 
+def validate_input(arr):
+    """
+    Validate a list of numbers (or numeric typed array), see validation.py.
 
-def merge_sort(arr: List[Any]) -> List[Any]:
+    Raises:
+        TypeError: If the input is not a list or numeric typed array.
+        ValueError: If an element is not a number.
     """
-    Merge Sort (Divide and Conquer)
+    validate_numbers(arr)
 
-    Pros:
-    - Stable
-    - Guaranteed O(n log n)
 
-    Cons:
-    - Uses extra memory
+def _sort(arr, sort_in_place, kind, backend, key, reverse, validate, as_array):
     """
-    validate_input(arr)
+    Shared body of the sorts returning a new list.
+
+    Validates the elements as numbers (or, when a key function is
+    given, the keys as mutually comparable) once, unless validate is
+    False, then sorts with either the
+    Python algorithm or a native backend of the matching kind. The
+    typed array of a native backend is returned as is when as_array
+    is True.
+    """
+    validator = validate_input if validate else None
+
+    if backend == "python":
+        return sort_with_key(arr, sort_in_place, key, reverse, validator)
 
-    if len(arr) <= 1:
-        return arr
+    keys = compute_keys(arr, key, validator)
+    if key is None:
+        return vectorized_sort(arr, kind=kind, backend=backend,
+                               as_array=as_array, reverse=reverse)
+    return [arr[i] for i in argsort(keys, backend=backend, reverse=reverse)]
 
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
 
-    result = []
-    i = j = 0
+def merge_sort(arr: List[Any], backend: str = "python", key=None,
+               reverse: bool = False, validate: bool = True,
+               as_array: bool = False) -> List[Any]:
+    """
+    Merge Sort (bottom-up, returns a new list)
 
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
-            i += 1
-        else:
-            result.append(right[j])
-            j += 1
+    Validates the input once, then sorts a copy with an iterative
+    natural merge sort (see natural_merge.py): existing ascending and
+    descending runs are detected and merged pairwise through a single
+    auxiliary buffer, galloping over long one-sided stretches.
+
+    Pros:
+    - Stable
+    - Guaranteed O(n log n), O(n) on already sorted input
+    - No recursion
 
-    result.extend(left[i:])
-    result.extend(right[j:])
-    return result
+    Cons:
+    - Uses extra memory (the copy plus one buffer of the same size)
+
+    Args:
+        arr: The numbers to sort, or any elements when key is given
+            (not modified).
+        backend: "python" for the algorithm above, "numpy" for a stable
+            native sort, "array" for the built-in timsort with an
+            optional array.array result, or "auto" for "numpy" when it
+            is installed and "array" otherwise (see vectorized_sort.py).
+        key: Function computing a comparable sort key (e.g. a number,
+            string or tuple) for each element, called once per element.
+        reverse: Sort in descending order.
+        validate: Set to False to skip input validation for trusted input.
+        as_array: With a backend other than "python", return the sorted
+            numpy.ndarray / array.array itself instead of a list (only
+            for plain ints or floats without a key).
+    """
+    return _sort(arr, natural_merge_sort, "mergesort", backend, key, reverse,
+                 validate, as_array)
 
 
-def quick_sort(arr: List[Any]) -> List[Any]:
+def quick_sort(arr: List[Any], backend: str = "python", key=None,
+               reverse: bool = False, validate: bool = True,
+               as_array: bool = False) -> List[Any]:
     """
-    Quick Sort
+    Quick Sort (returns a new list)
+
+    Sorts a copy of the input with the in-place introsort engine
+    (see introsort.py).
 
     Pros:
     - Fast average performance
-    - Low memory usage
+    - O(n log n) worst case thanks to the heapsort fallback
+    - Only one copy of the input is allocated
 
     Cons:
-    - Worst case O(n²)
-    - Not stable
+    - Not stable (stable when key or reverse is given, see sort_keys.py)
+
+    Args:
+        arr: The numbers to sort, or any elements when key is given
+            (not modified).
+        backend: "python" for the algorithm above, "numpy" for a native
+            quicksort, "array" for the built-in timsort with an optional
+            array.array result, or "auto" for "numpy" when it is
+            installed and "array" otherwise (see vectorized_sort.py).
+        key: Function computing a comparable sort key (e.g. a number,
+            string or tuple) for each element, called once per element.
+        reverse: Sort in descending order.
+        validate: Set to False to skip input validation for trusted input.
+        as_array: With a backend other than "python", return the sorted
+            numpy.ndarray / array.array itself instead of a list (only
+            for plain ints or floats without a key).
     """
-    validate_input(arr)
+    return _sort(arr, introsort, "quicksort", backend, key, reverse, validate,
+                 as_array)
 
-    if len(arr) <= 1:
-        return arr
 
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
+def intro_sort(arr: List[Any], key=None, reverse: bool = False,
+               validate: bool = True) -> List[Any]:
+    """
+    Introsort (in place)
 
-    return quick_sort(left) + middle + quick_sort(right)
+    Quicksort with median-of-three / ninther pivots, insertion sort for
+    small partitions and a heapsort fallback when partitioning gets too
+    deep. Uses an explicit stack instead of recursion.
 
+    Pros:
+    - O(n log n) worst case, even on sorted or adversarial input
+    - O(log n) extra memory
 
-def builtin_sort(arr: List[Any]) -> List[Any]:
+    Cons:
+    - Not stable (stable when key or reverse is given, see sort_keys.py)
+    - Mutates the input list or typed array (which is also returned)
+
+    Args:
+        arr: The numbers to sort in place, or any elements when key
+            is given.
+        key: Function computing a comparable sort key (e.g. a number,
+            string or tuple) for each element, called once per element.
+        reverse: Sort in descending order.
+        validate: Set to False to skip input validation for trusted input.
+    """
+    return sort_in_place_with_key(arr, introsort, key, reverse,
+                                  validate_input if validate else None)
+
+
+def builtin_sort(arr: List[Any], backend: str = "python", key=None,
+                 reverse: bool = False, validate: bool = True,
+                 as_array: bool = False) -> List[Any]:
     """
     Python Built-in Sort (Timsort)
 
@@ -87,6 +164,21 @@ def builtin_sort(arr: List[Any]) -> List[Any]:
 
     Cons:
     - Algorithm internals are abstracted
+
+    Args:
+        arr: The numbers to sort, or any elements when key is given
+            (not modified).
+        backend: "python" for sorted(), "numpy" for a stable native
+            sort, "array" for sorted() with an optional array.array
+            result, or "auto" for "numpy" when it is installed and
+            "array" otherwise (see vectorized_sort.py).
+        key: Function computing a comparable sort key (e.g. a number,
+            string or tuple) for each element, called once per element.
+        reverse: Sort in descending order.
+        validate: Set to False to skip input validation for trusted input.
+        as_array: With a backend other than "python", return the sorted
+            numpy.ndarray / array.array itself instead of a list (only
+            for plain ints or floats without a key).
     """
-    validate_input(arr)
-    return sorted(arr)
+    return _sort(arr, list.sort, "stable", backend, key, reverse, validate,
+                 as_array)
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+"""
+validation.py
+
+Input validation shared by the sorting modules.
+
+Every public sort validates its input once, at the entry point, and
+accepts ``validate=False`` to skip the check entirely for trusted
+callers. The checks themselves avoid per-element Python work:
+- Typed arrays (``array.array`` and 1-D ``memoryview`` objects with a
+  numeric format) can only hold numbers, so they pass in O(1)
+- For lists, ``set(map(type, arr))`` collects the distinct element
+  types in one C-level pass; the check then looks at each distinct
+  type once instead of calling isinstance on every element
+
+Only lists with an unusual mix of types fall back to the old
+pairwise comparison check (validate_comparable).
+"""
+
+from array import array
+
+NUMERIC_FORMATS = frozenset("bBhHiIlLqQfd")
+
+_NUMBER_TYPES = frozenset({int, float, bool})
+_ORDERED_TYPES = frozenset({str, bytes})
+
+
+def is_typed_numeric(arr):
+    """
+    Check whether a sequence is a typed array of numbers.
+
+    Returns:
+        bool: True for array.array and 1-D memoryview objects with a
+        numeric format.
+    """
+    if isinstance(arr, array):
+        return arr.typecode in NUMERIC_FORMATS
+    if isinstance(arr, memoryview):
+        return arr.ndim == 1 and arr.format.lstrip("@") in NUMERIC_FORMATS
+    return False
+
+
+def validate_numbers(arr):
+    """
+    Validate that the input is a list of numbers (ints or floats), or a
+    numeric typed array.
+
+    Args:
+        arr: The input to check.
+
+    Raises:
+        TypeError: If the input is not a list or numeric typed array.
+        ValueError: If an element is not a number.
+    """
+    if is_typed_numeric(arr):
+        return
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    types = set(map(type, arr))
+    if types <= _NUMBER_TYPES:
+        return
+    if not all(issubclass(kind, (int, float)) for kind in types):
+        raise ValueError("All elements must be numbers")
+
+
+def validate_comparable(arr):
+    """
+    Validate that the input is a list of mutually comparable elements,
+    or a numeric typed array.
+
+    Lists of numbers, or of a single string-like type, pass after one
+    pass over the element types; other lists are checked by comparing
+    each adjacent pair.
+
+    Args:
+        arr: The input to check.
+
+    Raises:
+        TypeError: If the input is not a list or numeric typed array.
+        ValueError: If the list contains non-comparable elements.
+    """
+    if is_typed_numeric(arr):
+        return
+    if not isinstance(arr, list):
+        raise TypeError("Input must be a list")
+
+    types = set(map(type, arr))
+    if types <= _NUMBER_TYPES or (len(types) == 1 and types <= _ORDERED_TYPES):
+        return
+
+    # Check if elements are comparable by attempting a comparison
+    for i in range(len(arr) - 1):
+        try:
+            _ = arr[i] < arr[i + 1]
+        except Exception:
+            raise ValueError("All elements in the list must be comparable")